@@ -5,29 +5,29 @@ A Python-based static site generator using Jinja2 templates and Markdown
 """
 from __future__ import annotations
 
-import copy
-import io
+import argparse
+import functools
+import hashlib
+import html
+import itertools
 import json
 import os
+import pickle
 import re
 import shutil
 import subprocess
 import sys
-import urllib.parse
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
-import argparse
-import frontmatter
-import yaml
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
-from markdown import markdown
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import get_lexer_by_name
-from tqdm import tqdm
+# Heavy dependencies are imported where they are used, so commands such
+# as --help, clean and serve start without loading them
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from markdown import Markdown
 
 # ============================================================================
 # CONSTANTS - Configuration and Magic Values
@@ -39,10 +39,16 @@ MONTHS = {
     "es": ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"],
     "it": ["Gen", "Feb", "Mar", "Apr", "Mag", "Giu", "Lug", "Ago", "Set", "Ott", "Nov", "Dic"]
 }
+_MONTH_IDX = {lang: tuple(names) for lang, names in MONTHS.items()}
 
 # Directory names
 DIR_ASSETS = 'assets'
 DIR_BUILD = 'build'
+DIR_BUILD_LOCAL = 'build-local'
+DIR_CACHE = '.codecraft-cache'
+DIR_CSS_CACHE = 'css'
+DIR_JINJA_CACHE = 'jinja'
+DIR_MARKDOWN_CACHE = 'markdown'
 DIR_SECTIONS = 'sections'
 DIR_CONTENT = 'content'
 DIR_PYCACHE = '__pycache__'
@@ -53,7 +59,9 @@ DIR_THEMES = 'themes'
 FILE_CONFIG_PATH = 'themes/config.yaml'
 FILE_CSS_TEMPLATE = 'codeCraft.css'
 FILE_CODECRAFT_CSS = 'codeCraft.css'
+FILE_BUILD_MANIFEST = 'build_manifest.json'
 FILE_FEED = 'feed.xml'
+FILE_FRONTMATTER_CACHE = 'frontmatter.pkl'
 FILE_SEARCH = 'search.json'
 
 # File extensions
@@ -65,26 +73,81 @@ EXT_JS = '.js'
 # Markdown configuration
 MD_EXTENSIONS = ['extra', 'toc']
 
+# Bump to invalidate cached markdown output after processing changes
+MARKDOWN_CACHE_VERSION = b'4'
+
 # CSS classes
 CSS_CLASS_HIGHLIGHT = 'highlight'
 CSS_CLASS_HIGHLIGHTER_ROUGE = 'highlighter-rouge'
 CSS_CLASS_LANGUAGE_PLAINTEXT = 'language-plaintext highlighter-rouge'
 CSS_CLASS_LANGUAGE_MERMAID = 'language-mermaid'
 
+# Code block wrappers
+_WRAP_OPEN = f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}">'
+_WRAP_CLOSE = '</div>'
+_PLAIN_OPEN = f'{_WRAP_OPEN}<div class="{CSS_CLASS_HIGHLIGHT}"><pre><code class="language-'
+_PLAIN_CLOSE = f'</code></pre></div>{_WRAP_CLOSE}'
+
 # Server defaults
 DEFAULT_SERVER_PORT = 8000
 
+# Watch mode: editors fire several events per save, coalesce them into one rebuild
+WATCH_DEBOUNCE_SECONDS = 0.2
+WATCH_IGNORED_SUFFIXES = ('.swp', '.swx', '.tmp', '~')
+
 # Regex patterns
-PATTERN_MERMAID_BLOCK = r'```mermaid\n(.*?)```'
-PATTERN_CODE_BLOCK = r'```(\w+)?\n(.*?)```'
+PATTERN_MERMAID_BLOCK = r'^```mermaid\n(.*?)^```'
+PATTERN_CODE_BLOCK = r'^```(\w+)?\n(.*?)^```'
 PATTERN_EXAMPLE_SHORTCODE = r'\[example:(\d+)\]'
+PATTERN_INCLUDE_DIRECTIVE = r'\{%-?\s*include\s+(posts|category|archive)\.html\s*-?%\}'
 PATTERN_BASE_TAG = rb'<base\s+href="[^"]*"[^>]*>\s*'
 PATTERN_CONSOLE_SUPPRESS = rb'// Aggressively suppress all console.*?\}\)\(\);\s*'
 
+# Compiled regexes
+_RE_BLOCKS = re.compile(
+    f'(?P<mermaid>{PATTERN_MERMAID_BLOCK})'
+    f'|(?P<code>{PATTERN_CODE_BLOCK})'
+    f'|(?P<example>{PATTERN_EXAMPLE_SHORTCODE})',
+    re.DOTALL | re.MULTILINE
+)
+_RE_INCLUDES = re.compile(PATTERN_INCLUDE_DIRECTIVE)
+_RE_FM_BOUNDARY = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+_RE_INLINE_CODE = re.compile(r'<code>(?!</code>)')
+_RE_MERMAID_RESTORE = re.compile(r'<p>MERMAID_PLACEHOLDER_(\d+)</p>')
+_RE_MULTIDASH = re.compile(r'-+')
+_RE_MULTIDASH_BYTES = re.compile(rb'-+')
+
+# Local dev server rewrites: literal replacements plus the <base> tag and
+# console suppression block, all applied in a single pass
+_LOCAL_REWRITES = {
+    b'https://lucianofedericopereira.github.io/codecraft/': b'/',
+    b'./assets/': b'/assets/',
+    b'"./examples/': b'"/examples/',
+    b"'examples/": b"'/examples/",
+}
+_RE_LOCAL_REWRITE = re.compile(
+    b'(?P<base>' + PATTERN_BASE_TAG + b')'
+    b'|(?P<console>' + PATTERN_CONSOLE_SUPPRESS + b')'
+    b'|' + b'|'.join(map(re.escape, _LOCAL_REWRITES)),
+    re.DOTALL
+)
+
+# ASCII slug tables: alphanumerics lowercased, space/dash to dash, rest dropped
+_SLUG_TABLE = bytes(
+    ord(chr(b).lower()) if b < 128 and chr(b).isalnum() else ord('-') if b in b' -' else b
+    for b in range(256)
+)
+_SLUG_DELETE = bytes(b for b in range(128) if not (chr(b).isalnum() or chr(b) in ' -'))
+
 # Include directive placeholders
 PLACEHOLDER_POSTS = 'INCLUDE_POSTS_PLACEHOLDER'
 PLACEHOLDER_CATEGORY = 'INCLUDE_CATEGORY_PLACEHOLDER'
 PLACEHOLDER_ARCHIVE = 'INCLUDE_ARCHIVE_PLACEHOLDER'
+INCLUDE_PLACEHOLDERS = {
+    'posts': PLACEHOLDER_POSTS,
+    'category': PLACEHOLDER_CATEGORY,
+    'archive': PLACEHOLDER_ARCHIVE,
+}
 
 # Template names
 TEMPLATE_MAIN = 'codeCraft.html'
@@ -95,6 +158,24 @@ TEMPLATE_ARCHIVE = 'archive.html'
 # Post limits
 DEFAULT_POST_LIMIT = 10
 FEED_POST_LIMIT = 10
+SEARCH_CONTENT_LENGTH = 200
+
+# Frontmatter feature defaults before path rules apply
+PATH_DEFAULT_FEATURES = {
+    'toc': False,
+    'comments': False,
+    'mermaid': False,
+    'codepen': False,
+    'banner': False
+}
+
+# Minimum number of files before conversion and rendering use a process pool. Each
+# worker builds its own SiteBuilder, which only pays off on sites with hundreds of files
+PARALLEL_MIN_FILES = 200
+
+# Minimum number of files before copying uses a thread pool
+COPY_PARALLEL_MIN_FILES = 8
+COPY_MAX_THREADS = 8
 
 # Font weight mappings
 FONT_WEIGHT_MAP = {
@@ -113,6 +194,7 @@ FONT_WEIGHT_MAP = {
 DEFAULT_CONFIG = {
     "post_limit": DEFAULT_POST_LIMIT,
     "search_enabled": False,
+    "search_template": False,
     "base": {
         "url": "localhost",
         "folder": ""
@@ -170,6 +252,7 @@ MESSAGES = {
     },
     "examples": [
         "%(prog)s build Build the site",
+        "%(prog)s build --clean-cache Rebuild without cached markdown",
         "%(prog)s serve Start local server (port 8000)",
         "%(prog)s serve -p 3000 Start local server on port 3000",
         "%(prog)s watch Watch for changes and rebuild",
@@ -184,6 +267,7 @@ MESSAGES = {
         "new": "Create a new blog post",
         "category": "Post category",
         "clean": "Clean build artifacts",
+        "clean_cache": "Discard cached markdown output before building",
         "port": f"Port number (default: {DEFAULT_SERVER_PORT})",
         "title": "Post title",
         "slug": "URL-friendly slug (auto-generated if not provided)",
@@ -232,7 +316,7 @@ MESSAGES = {
         "server_start": "Starting local server at http://localhost:{}",
         "server_stop_hint": "Press Ctrl+C to stop",
         "server_stopped": "Server stopped",
-        "server_rewrite": "(Auto-rewrites <base> tags for local development)",
+        "server_rewrite": "(Serving the build-local tree, <base> tags rewritten at build time)",
         "step_build": "2. Build: python codecraft.py build",
         "step_edit": "1. Edit: {}",
         "step_deploy": "4. Deploy: git add {} && git commit -m 'Add: {}' && git push",
@@ -258,7 +342,7 @@ INFO = " \033[94mℹ\033[0m"
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PostData:
     """Represents a blog post or page with its metadata"""
     content: str
@@ -295,22 +379,241 @@ def apply_defaults(data: Optional[Dict], defaults: Dict) -> Dict:
     Returns:
         Merged dictionary with defaults applied
     """
-    def deep_merge(target: Dict, source: Dict) -> Dict:
+    merged_data = dict(data) if data else {}
+
+    # Only dicts that receive defaults are copied, so data is never mutated
+    stack = [(merged_data, defaults)]
+    while stack:
+        target, source = stack.pop()
         for key, value in source.items():
             if isinstance(value, dict):
-                node = target.setdefault(key, {})
-                deep_merge(node, value)
+                node = dict(target[key]) if key in target else {}
+                target[key] = node
+                stack.append((node, value))
             else:
                 target.setdefault(key, value)
-        return target
 
-    merged_data = copy.deepcopy(data) if data else {}
-    return deep_merge(merged_data, defaults)
+    return merged_data
 
 
 def strip_all_whitespace(value: str) -> str:
     """Remove all whitespace from a string"""
-    return re.sub(r'\s+', '', value)
+    return ''.join(value.split())
+
+
+def _split_filter(value: str, sep: str) -> List[str]:
+    """Jinja filter splitting a string, empty values give an empty list
+
+    Args:
+        value: String to split
+        sep: Separator
+
+    Returns:
+        List of parts
+    """
+    return value.split(sep) if value else []
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON, using orjson when installed
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to a file unless it already holds exactly those bytes
+
+    Args:
+        path: Output file path
+        data: Encoded file contents
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+def copy_if_changed(src: str, dst: str) -> str:
+    """Copy a file unless the destination already matches its size and mtime
+
+    Uses os.copy_file_range where available, which the kernel can serve as a
+    copy-on-write reflink, and falls back to shutil.copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path, like shutil.copy2
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+        if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+            return dst
+    except OSError:
+        pass
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = src_stat.st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+
+    return shutil.copy2(src, dst)
+
+
+def scan_tree(src: str, dst: str, pairs: List[Tuple[str, str]]) -> None:
+    """Create a tree's directories under dst and list its files with their destinations
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        pairs: List to extend with (source file, destination file) pairs
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                scan_tree(entry.path, target, pairs)
+            else:
+                pairs.append((entry.path, target))
+
+
+def copy_files(pairs: List[Tuple[str, str]], copy_function=copy_if_changed) -> None:
+    """Copy files, on a thread pool when there are enough to overlap their IO
+
+    Args:
+        pairs: (source file, destination file) pairs
+        copy_function: Per-file copy callable taking (src, dst)
+    """
+    if len(pairs) < COPY_PARALLEL_MIN_FILES:
+        for src, dst in pairs:
+            copy_function(src, dst)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(COPY_MAX_THREADS, len(pairs))) as executor:
+        list(executor.map(copy_function, *zip(*pairs)))
+
+
+def sync_tree(src: Path, dst: Path, copy_function=copy_if_changed, exclude: Tuple[str, ...] = ()) -> None:
+    """Mirror a directory tree, copying changed files and removing stale ones
+
+    Args:
+        src: Source directory
+        dst: Destination directory
+        copy_function: Per-file copy callable taking (src, dst)
+        exclude: Top-level file names that are neither copied nor removed
+    """
+    pairs = []
+    scan_tree(str(src), str(dst), pairs)
+    if exclude:
+        skipped = {os.path.join(str(src), name) for name in exclude}
+        pairs = [pair for pair in pairs if pair[0] not in skipped]
+    copy_files(pairs, copy_function)
+
+    for dirpath, dirnames, filenames in os.walk(dst, topdown=False):
+        rel_dir = os.path.relpath(dirpath, dst)
+        src_dir = src / rel_dir
+        for name in filenames:
+            if rel_dir == '.' and name in exclude:
+                continue
+            if not (src_dir / name).is_file():
+                os.remove(os.path.join(dirpath, name))
+        for name in dirnames:
+            if not (src_dir / name).is_dir():
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+
+
+def _local_rewrite(match: re.Match) -> bytes:
+    """Replacement callback for _RE_LOCAL_REWRITE"""
+    kind = match.lastgroup
+    if kind == 'base':
+        return b''
+    if kind == 'console':
+        return b'// Console suppression disabled for local development\n\n        '
+    # Rewrite absolute URLs to relative for local development
+    return _LOCAL_REWRITES[match.group(0)]
+
+
+def rewrite_for_local(path: str, content: bytes) -> bytes:
+    """Rewrite built HTML and JavaScript so it works from the local dev server
+
+    Args:
+        path: File path, used to pick the rewrite by extension
+        content: Original file contents
+
+    Returns:
+        Rewritten file contents
+    """
+    if path.endswith(EXT_HTML):
+        content = _RE_LOCAL_REWRITE.sub(_local_rewrite, content)
+    elif path.endswith(EXT_JS):
+        content = content.replace(b'`examples/${', b'`/examples/${')
+    return content
+
+
+def copy_local_variant(src: str, dst: str) -> str:
+    """Copy a built file into the local tree, rewriting HTML and JavaScript
+
+    Rewritten files are stamped with the source mtime, so unchanged sources
+    are skipped after a single stat instead of being read and rewritten.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path, like shutil.copy2
+    """
+    if src.endswith((EXT_HTML, EXT_JS)):
+        src_stat = os.stat(src)
+        try:
+            if os.stat(dst).st_mtime_ns == src_stat.st_mtime_ns:
+                return dst
+        except OSError:
+            pass
+
+        with open(src, 'rb') as f:
+            write_if_changed(Path(dst), rewrite_for_local(src, f.read()))
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return dst
+    return copy_if_changed(src, dst)
 
 
 def normalize_url_path(path: str) -> str:
@@ -334,19 +637,23 @@ def slugify(text: str) -> str:
     Returns:
         URL-safe slug
     """
-    slug = text.lower()
-    slug = ''.join(c if c.isalnum() or c in ' -' else '' for c in slug)
-    slug = slug.replace(' ', '-').strip('-')
-    # Remove consecutive dashes
-    while '--' in slug:
-        slug = slug.replace('--', '-')
-    return slug
+    if text.isascii():
+        slug = text.encode('ascii').translate(_SLUG_TABLE, _SLUG_DELETE)
+        # Remove consecutive dashes
+        return _RE_MULTIDASH_BYTES.sub(b'-', slug).strip(b'-').decode('ascii')
+    else:
+        slug = text.lower()
+        slug = ''.join(c if c.isalnum() or c in ' -' else '' for c in slug)
+        slug = slug.replace(' ', '-')
+        # Remove consecutive dashes
+        return _RE_MULTIDASH.sub('-', slug).strip('-')
 
 
 # ============================================================================
 # DATE FORMATTING FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def format_month_year(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM date string to abbreviated month + year
 
@@ -360,13 +667,16 @@ def format_month_year(date_str: str, lang: str = "en") -> str:
     if not date_str:
         return ""
     try:
-        year, month = str(date_str).split("-")[:2]
-        month_index = int(month) - 1
-        return f"{MONTHS.get(lang, MONTHS['en'])[month_index]} {year}"
+        year, sep, rest = str(date_str).partition("-")
+        if not sep:
+            return str(date_str)
+        month_index = int(rest.partition("-")[0]) - 1
+        return f"{_MONTH_IDX.get(lang, _MONTH_IDX['en'])[month_index]} {year}"
     except Exception:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date_archive(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM-DD date string to 3-letter month + padded day
 
@@ -380,17 +690,18 @@ def format_date_archive(date_str: str, lang: str = "en") -> str:
     if not date_str:
         return ""
     try:
-        parts = str(date_str).split("-")
-        if len(parts) >= 3:
-            year, month, day = parts[:3]
-            month_index = int(month) - 1
-            day_num = int(day)
-            return f"{MONTHS.get(lang, MONTHS['en'])[month_index]} {day_num:02d}"
-        return str(date_str)
+        year, _, rest = str(date_str).partition("-")
+        month, sep, rest = rest.partition("-")
+        if not sep:
+            return str(date_str)
+        month_index = int(month) - 1
+        day_num = int(rest.partition("-")[0])
+        return f"{_MONTH_IDX.get(lang, _MONTH_IDX['en'])[month_index]} {day_num:02d}"
     except Exception:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_year(date_str: str) -> str:
     """Extract year from YYYY-MM-DD date string
 
@@ -403,11 +714,12 @@ def extract_year(date_str: str) -> str:
     if not date_str:
         return ""
     try:
-        return str(date_str).split("-")[0]
+        return str(date_str).partition("-")[0]
     except Exception:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date_full(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM-DD date string to 3-letter month + padded day + year
 
@@ -421,13 +733,13 @@ def format_date_full(date_str: str, lang: str = "en") -> str:
     if not date_str:
         return ""
     try:
-        parts = str(date_str).split("-")
-        if len(parts) >= 3:
-            year, month, day = parts[:3]
-            month_index = int(month) - 1
-            day_num = int(day)
-            return f"{MONTHS.get(lang, MONTHS['en'])[month_index]} {day_num:02d}, {year}"
-        return str(date_str)
+        year, _, rest = str(date_str).partition("-")
+        month, sep, rest = rest.partition("-")
+        if not sep:
+            return str(date_str)
+        month_index = int(month) - 1
+        day_num = int(rest.partition("-")[0])
+        return f"{_MONTH_IDX.get(lang, _MONTH_IDX['en'])[month_index]} {day_num:02d}, {year}"
     except Exception:
         return str(date_str)
 
@@ -442,7 +754,6 @@ def format_date_jinja(value: Any, format: str = '%B %d, %Y') -> str:
     Returns:
         Formatted date string
     """
-    from datetime import date
     if isinstance(value, str):
         try:
             value = datetime.strptime(value, '%Y-%m-%d')
@@ -457,6 +768,21 @@ def format_date_jinja(value: Any, format: str = '%B %d, %Y') -> str:
 # TEMPLATE RENDERING
 # ============================================================================
 
+@functools.lru_cache(maxsize=128)
+def _placeholder_pattern(placeholders: Tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern matching any placeholder, bare or wrapped in a paragraph
+
+    Args:
+        placeholders: Placeholder strings
+
+    Returns:
+        Compiled pattern, group 1 for a wrapped placeholder and group 2 for a bare one
+    """
+    # Longest first so EXAMPLE_PLACEHOLDER_10 is not matched as EXAMPLE_PLACEHOLDER_1
+    alternation = '|'.join(map(re.escape, sorted(placeholders, key=len, reverse=True)))
+    return re.compile(f'<p>({alternation})</p>|({alternation})')
+
+
 def render_template_safe(env: Environment, template_name: str, context: Dict) -> Optional[str]:
     """Safely render a template with comprehensive error handling
 
@@ -468,6 +794,8 @@ def render_template_safe(env: Environment, template_name: str, context: Dict) ->
     Returns:
         Rendered string or None on error
     """
+    from jinja2 import TemplateNotFound
+
     try:
         template = env.get_template(template_name)
     except TemplateNotFound:
@@ -499,104 +827,118 @@ def extract_include_directives(content: str) -> Tuple[str, Dict[str, str]]:
     """
     include_directives = {}
 
-    # Posts include
-    if '{%- include posts.html -%}' in content or '{% include posts.html %}' in content:
-        include_directives[PLACEHOLDER_POSTS] = 'posts'
-        content = content.replace('{%- include posts.html -%}', PLACEHOLDER_POSTS)
-        content = content.replace('{% include posts.html %}', PLACEHOLDER_POSTS)
-
-    # Category include
-    if '{%- include category.html -%}' in content or '{% include category.html %}' in content:
-        include_directives[PLACEHOLDER_CATEGORY] = 'category'
-        content = content.replace('{%- include category.html -%}', PLACEHOLDER_CATEGORY)
-        content = content.replace('{% include category.html %}', PLACEHOLDER_CATEGORY)
-
-    # Archive include
-    if '{%- include archive.html -%}' in content or '{% include archive.html %}' in content:
-        include_directives[PLACEHOLDER_ARCHIVE] = 'archive'
-        content = content.replace('{%- include archive.html -%}', PLACEHOLDER_ARCHIVE)
-        content = content.replace('{% include archive.html %}', PLACEHOLDER_ARCHIVE)
+    def replace_include(match):
+        directive_type = match.group(1)
+        placeholder = INCLUDE_PLACEHOLDERS[directive_type]
+        include_directives[placeholder] = directive_type
+        return placeholder
 
+    content = _RE_INCLUDES.sub(replace_include, content)
     return content, include_directives
 
 
-def extract_example_shortcodes(content: str, directives: Dict[str, str]) -> str:
-    """Replace [example:N] shortcodes with placeholders
+def restore_mermaid_blocks(content_html: str, mermaid_blocks: List[str]) -> str:
+    """Restore mermaid blocks with proper language class
 
     Args:
-        content: Markdown content
-        directives: Dictionary to store directive mappings
+        content_html: HTML content with placeholders
+        mermaid_blocks: List of mermaid block contents
 
     Returns:
-        Content with placeholders
+        HTML with restored mermaid blocks
     """
-    def replace_example(match):
-        example_id = match.group(1)
-        placeholder = f'EXAMPLE_PLACEHOLDER_{example_id}'
-        directives[placeholder] = f'example:{example_id}'
-        return f'\n\n{placeholder}\n\n'
+    if not mermaid_blocks:
+        return content_html
 
-    return re.sub(PATTERN_EXAMPLE_SHORTCODE, replace_example, content)
+    def restore_mermaid(match):
+        index = int(match.group(1))
+        if index >= len(mermaid_blocks):
+            return match.group(0)
+        return f'<pre><code class="{CSS_CLASS_LANGUAGE_MERMAID}">{mermaid_blocks[index]}</code></pre>'
 
+    return _RE_MERMAID_RESTORE.sub(restore_mermaid, content_html)
 
-def extract_mermaid_blocks(content: str) -> Tuple[str, List[str]]:
-    """Extract mermaid blocks and replace with placeholders
 
-    Args:
-        content: Markdown content
+@functools.lru_cache(maxsize=1)
+def _get_formatter():
+    """Create the shared Pygments formatter, its options never vary between code blocks
+
+    The token styles live in the theme stylesheet, so only the formatter's
+    class tables are needed and they are built once per process.
 
     Returns:
-        Tuple of (content with placeholders, list of mermaid blocks)
+        HtmlFormatter instance
     """
-    mermaid_blocks = []
+    from pygments.formatters import HtmlFormatter
+    return HtmlFormatter(cssclass=CSS_CLASS_HIGHLIGHT, noclasses=False)
 
-    def save_mermaid(match):
-        mermaid_blocks.append(match.group(1))
-        return f'\n\nMERMAID_PLACEHOLDER_{len(mermaid_blocks)-1}\n\n'
 
-    content = re.sub(PATTERN_MERMAID_BLOCK, save_mermaid, content, flags=re.DOTALL)
-    return content, mermaid_blocks
+@functools.lru_cache(maxsize=64)
+def _get_lexer(lang: str):
+    """Look up a Pygments lexer by language name, memoized per language
 
+    Args:
+        lang: Language name from the code fence
 
-def restore_mermaid_blocks(content_html: str, mermaid_blocks: List[str]) -> str:
-    """Restore mermaid blocks with proper language class
+    Returns:
+        Lexer instance, or None if no lexer matches the name
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+
+    try:
+        return get_lexer_by_name(lang, stripall=False)
+    except ClassNotFound:
+        return None
+
+
+def highlight_code(lang: str, code: str) -> str:
+    """Highlight a single fenced code block with Pygments
 
     Args:
-        content_html: HTML content with placeholders
-        mermaid_blocks: List of mermaid block contents
+        lang: Language name from the code fence
+        code: Code block contents
 
     Returns:
-        HTML with restored mermaid blocks
+        Highlighted HTML, or a plain code block if the language is unknown
     """
-    for i, mermaid_content in enumerate(mermaid_blocks):
-        content_html = content_html.replace(
-            f'<p>MERMAID_PLACEHOLDER_{i}</p>',
-            f'<pre><code class="{CSS_CLASS_LANGUAGE_MERMAID}">{mermaid_content}</code></pre>'
-        )
-    return content_html
+    lexer = _get_lexer(lang)
+    if lexer is not None:
+        from pygments import highlight
+        return _WRAP_OPEN + highlight(code, lexer, _get_formatter()) + _WRAP_CLOSE
+    return ''.join((_PLAIN_OPEN, lang, '">', html.escape(code), _PLAIN_CLOSE))
+
 
+def extract_fenced_blocks(content: str, directives: Dict[str, str]) -> Tuple[str, List[str]]:
+    """Extract mermaid blocks and example shortcodes and highlight code blocks
 
-def highlight_code_blocks(content: str) -> str:
-    """Process fenced code blocks with Pygments syntax highlighting
+    All three constructs are matched by one regex, so the content is
+    scanned once instead of once per construct.
 
     Args:
-        content: Markdown content with fenced code blocks
+        content: Markdown content
+        directives: Dictionary to store example directive mappings
 
     Returns:
-        Content with highlighted code blocks
+        Tuple of (content with placeholders and highlighted code, list of mermaid blocks)
     """
-    def highlight_match(match):
-        lang = match.group(1) or 'text'
-        code = match.group(2)
-        try:
-            lexer = get_lexer_by_name(lang, stripall=False)
-            formatter = HtmlFormatter(cssclass=CSS_CLASS_HIGHLIGHT, noclasses=False)
-            highlighted = highlight(code, lexer, formatter)
-            return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}">{highlighted}</div>'
-        except:
-            return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}"><div class="{CSS_CLASS_HIGHLIGHT}"><pre><code class="language-{lang}">{code}</code></pre></div></div>'
+    mermaid_blocks = []
 
-    return re.sub(PATTERN_CODE_BLOCK, highlight_match, content, flags=re.DOTALL)
+    def replace_block(match):
+        kind = match.lastgroup
+        if kind == 'mermaid':
+            mermaid_blocks.append(match.group(2))
+            return f'\n\nMERMAID_PLACEHOLDER_{len(mermaid_blocks)-1}\n\n'
+        if kind == 'code':
+            return highlight_code(match.group(4) or 'text', match.group(5))
+        example_id = match.group(7)
+        # Interned so the same example shares one key string across posts
+        placeholder = sys.intern(f'EXAMPLE_PLACEHOLDER_{example_id}')
+        directives[placeholder] = f'example:{example_id}'
+        return f'\n\n{placeholder}\n\n'
+
+    content = _RE_BLOCKS.sub(replace_block, content)
+    return content, mermaid_blocks
 
 
 def add_inline_code_classes(content_html: str) -> str:
@@ -608,13 +950,26 @@ def add_inline_code_classes(content_html: str) -> str:
     Returns:
         HTML with classes added to inline code
     """
-    return re.sub(
-        r'<code>(?!</code>)',
+    return _RE_INLINE_CODE.sub(
         f'<code class="{CSS_CLASS_LANGUAGE_PLAINTEXT}">',
         content_html
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_markdown_converter() -> Markdown:
+    """Create the Markdown converter once per process
+
+    Building a converter loads every extension and compiles its
+    patterns, so a single instance is reset and reused per document.
+
+    Returns:
+        Markdown converter configured with MD_EXTENSIONS
+    """
+    from markdown import Markdown
+    return Markdown(extensions=MD_EXTENSIONS, extension_configs={})
+
+
 def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
     """Process markdown content with all transformations
 
@@ -627,17 +982,11 @@ def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
     # Extract include directives
     content, include_directives = extract_include_directives(content)
 
-    # Extract example shortcodes
-    content = extract_example_shortcodes(content, include_directives)
-
-    # Extract mermaid blocks
-    content, mermaid_blocks = extract_mermaid_blocks(content)
-
-    # Highlight code blocks
-    content = highlight_code_blocks(content)
+    # Extract mermaid blocks and example shortcodes, highlight code blocks
+    content, mermaid_blocks = extract_fenced_blocks(content, include_directives)
 
     # Convert markdown to HTML
-    content_html = markdown(content, extensions=MD_EXTENSIONS, extension_configs={})
+    content_html = _get_markdown_converter().reset().convert(content)
 
     # Add classes to inline code
     content_html = add_inline_code_classes(content_html)
@@ -648,6 +997,126 @@ def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
     return content_html, include_directives
 
 
+def markdown_cache_name(body: str) -> str:
+    """Name the cache file holding the processed output of a markdown body
+
+    Args:
+        body: Raw markdown content
+
+    Returns:
+        Cache file name derived from the content hash
+    """
+    return hashlib.blake2b(MARKDOWN_CACHE_VERSION + body.encode('utf-8'), digest_size=16).hexdigest() + '.pkl'
+
+
+def md_to_html_cached(body: str, cache_dir: Path) -> Tuple[str, Dict[str, str]]:
+    """Process markdown content, reusing cached output for unchanged bodies
+
+    Args:
+        body: Raw markdown content
+        cache_dir: Directory holding cached results keyed by content hash
+
+    Returns:
+        Tuple of (processed HTML, include directives dict)
+    """
+    cache_file = cache_dir / markdown_cache_name(body)
+
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Corrupt or truncated entry, convert again and replace it
+            cache_file.unlink(missing_ok=True)
+
+    result = process_markdown_content(body)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """Pick the fastest available safe YAML loader
+
+    Returns:
+        yaml.CSafeLoader when libyaml is available, otherwise yaml.SafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+    return YamlLoader
+
+
+def split_frontmatter(text: str) -> Tuple[Dict, str]:
+    """Split a markdown document into its YAML frontmatter and body
+
+    Follows python-frontmatter's YAML handling: the document must open with a
+    --- boundary, and both the document and the body are stripped.
+
+    Args:
+        text: Markdown document
+
+    Returns:
+        Tuple of (metadata dictionary, markdown body)
+    """
+    import yaml
+
+    text = text.strip()
+    if not _RE_FM_BOUNDARY.match(text):
+        return {}, text
+
+    parts = _RE_FM_BOUNDARY.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+
+    metadata = yaml.load(parts[1], Loader=_get_yaml_loader())
+    return (metadata if isinstance(metadata, dict) else {}), parts[2].strip()
+
+
+def load_markdown_file(file_path: Path, cache_dir: Path,
+                       parsed: Optional[Tuple[Dict, str]] = None) -> Optional[Tuple[Dict, str, Dict[str, str], str]]:
+    """Read a markdown file and convert its body to HTML
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        file_path: Path to markdown file
+        cache_dir: Directory holding cached markdown output
+        parsed: Previously parsed (metadata, body) for an unchanged file
+
+    Returns:
+        Tuple of (frontmatter metadata, processed HTML, include directives, markdown body)
+        or None on error
+    """
+    if parsed is None:
+        try:
+            # One bulk decode instead of the incremental text-mode reader
+            with open(file_path, 'rb') as f:
+                text = f.read().decode('utf-8')
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            parsed = split_frontmatter(text)
+        except Exception as e:
+            print(f'{CROSS} {MESSAGES["error"]["reading_file"].format(file_path, e)}')
+            return None
+
+    metadata, body = parsed
+
+    try:
+        content_html, include_directives = md_to_html_cached(body, cache_dir)
+    except Exception as e:
+        print(f'{CROSS} {MESSAGES["error"]["parsing_markdown"].format(file_path, e)}')
+        return None
+
+    return metadata, content_html, include_directives, body
+
+
 # ============================================================================
 # SITE BUILDER
 # ============================================================================
@@ -662,16 +1131,30 @@ class SiteBuilder:
             config_path: Path to config file
         """
         self.root_dir = Path(__file__).parent
+        self.config_path = config_path
         self.config = self._load_config(config_path)
+        self._path_rules = self._compile_path_rules()
         self.output_dir = self.root_dir / DIR_BUILD
+        self.cache_dir = self.root_dir / DIR_CACHE
+        self.markdown_cache_dir = self.cache_dir / DIR_MARKDOWN_CACHE
+        self.frontmatter_cache = self._load_frontmatter_cache()
+        self.frontmatter_seen = {}
+        self.loaded_cache = {}
+        self.loaded_seen = {}
         self.theme_dir = self.root_dir / DIR_THEMES
         self.templates_dir = self.theme_dir / DIR_TEMPLATES
 
         # Set base URL
         self.base_url = self._build_base_url()
 
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment and resolve templates once per build
         self.env = self._create_jinja_environment()
+        self._tpl_main = self.env.get_template(TEMPLATE_MAIN)
+        self._tpl_posts = self.env.get_template(TEMPLATE_POSTS)
+        self._tpl_category = self.env.get_template(TEMPLATE_CATEGORY)
+        self._tpl_archive = self.env.get_template(TEMPLATE_ARCHIVE)
+        self._tpl_feed = self.env.get_template(FILE_FEED)
+        self._tpl_css = self.env.get_template(FILE_CSS_TEMPLATE)
 
         # Resolve asset URLs
         self.asset_urls = self._get_asset_urls()
@@ -680,6 +1163,43 @@ class SiteBuilder:
         sections = self.config.get('sections', [])
         self.posts = {name: [] for name in sections} if sections else {'design': [], 'code': [], 'projects': []}
         self.pages = []
+        self._all_posts_sorted = None
+        self._top_posts = None
+        self._base_context = None
+        self._reset_rendered_includes()
+
+        # Incremental build state: output path -> [page hash, output size, output mtime_ns]
+        self.deps_hash = ''
+        self.manifest = {}
+        self.rendered_outputs = {}
+        self._created_dirs = set()
+        self._listing_hash = b''
+        self._posts_hash = b''
+
+    def reset(self) -> None:
+        """Forget collected content so build() can run again on this builder
+
+        Configuration, templates and the files loaded by the previous build
+        are kept, so a rebuild after a content edit only loads changed files.
+        Any change to configuration, templates or code needs a new builder.
+        """
+        self.frontmatter_cache, self.frontmatter_seen = self.frontmatter_seen, {}
+        self.loaded_cache, self.loaded_seen = self.loaded_seen, {}
+
+        for collection in self.posts.values():
+            collection.clear()
+        self.pages = []
+        self._all_posts_sorted = None
+        self._top_posts = None
+        self._base_context = None
+        self._reset_rendered_includes()
+
+        self.deps_hash = ''
+        self.manifest = {}
+        self.rendered_outputs = {}
+        self._created_dirs = set()
+        self._listing_hash = b''
+        self._posts_hash = b''
 
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file
@@ -690,6 +1210,8 @@ class SiteBuilder:
         Returns:
             Configuration dictionary
         """
+        import yaml
+
         config_file = self.root_dir / config_path
         config = {}
 
@@ -698,8 +1220,8 @@ class SiteBuilder:
             print(f'{INFO}  {MESSAGES["info"]["using_default_config"]}')
         else:
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                with open(config_file, 'rb') as f:
+                    config = yaml.load(f, Loader=_get_yaml_loader())
                     config = config if config else {}
             except yaml.YAMLError as e:
                 print(f'{CROSS} {MESSAGES["error"]["invalid_yaml"].format(config_path, e)}')
@@ -732,9 +1254,23 @@ class SiteBuilder:
         Returns:
             Configured Jinja2 Environment
         """
+        from jinja2 import (
+            Environment,
+            FileSystemBytecodeCache,
+            FileSystemLoader,
+            select_autoescape,
+        )
+
+        # Compiled templates persist on disk so later builds skip parsing
+        bytecode_dir = self.cache_dir / DIR_JINJA_CACHE
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+
         env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
+            autoescape=select_autoescape(enabled_extensions=('html', 'xml'), default_for_string=False),
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir), '%s.cache')
         )
 
         # Add custom filters
@@ -744,7 +1280,9 @@ class SiteBuilder:
         env.filters['date_full'] = format_date_full
         env.filters['year'] = extract_year
         env.filters['strip_whitespace'] = strip_all_whitespace
-        env.filters['split'] = lambda s, sep: s.split(sep) if s else []
+        env.filters['split'] = _split_filter
+        # Stamped with the build time by build() and by render workers
+        env.globals['now'] = None
 
         return env
 
@@ -770,28 +1308,29 @@ class SiteBuilder:
         Returns:
             Dictionary of default values
         """
-        rules_config = self.config.get('rules', [])
         file_path_str = str(file_path)
+        defaults = PATH_DEFAULT_FEATURES.copy()
 
-        defaults = {
-            'toc': False,
-            'comments': False,
-            'mermaid': False,
-            'codepen': False,
-            'banner': False
-        }
-
-        for rule in rules_config:
-            scope = rule.get('scope', {})
-            scope_path = scope.get('path', '')
-
-            if scope_path and scope_path in file_path_str:
-                if 'features' in rule:
-                    defaults.update(rule['features'])
+        for scope_path, features in self._path_rules:
+            if scope_path in file_path_str:
+                defaults.update(features)
 
         return defaults
 
-    def parse_markdown_file(self, file_path: Path, is_post: bool = True) -> Optional[Dict]:
+    def _compile_path_rules(self) -> List[Tuple[str, Dict]]:
+        """Reduce config rules to the (scope path, features) pairs that can apply
+
+        Returns:
+            List of (scope path, features) tuples in config order
+        """
+        path_rules = []
+        for rule in self.config.get('rules', []):
+            scope_path = rule.get('scope', {}).get('path', '')
+            if scope_path and 'features' in rule:
+                path_rules.append((scope_path, rule['features']))
+        return path_rules
+
+    def parse_markdown_file(self, file_path: Path, is_post: bool = True) -> Optional[PostData]:
         """Parse a markdown file with frontmatter
 
         Args:
@@ -799,67 +1338,183 @@ class SiteBuilder:
             is_post: True for blog posts, False for pages
 
         Returns:
-            Dictionary with post data or None on error
+            PostData record or None on error
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-        except Exception as e:
-            print(f'{CROSS} {MESSAGES["error"]["reading_file"].format(file_path, e)}')
-            return None
+        return self._build_page_data(file_path, load_markdown_file(file_path, self.markdown_cache_dir), is_post)
 
-        path_defaults = self._get_path_defaults(file_path)
+    def _load_frontmatter_cache(self) -> Dict[Tuple[str, int, int], Tuple[Dict, str]]:
+        """Load parsed frontmatter from the previous build
 
+        Returns:
+            Dictionary mapping (path, mtime_ns, size) to (metadata, body)
+        """
         try:
-            content_html, include_directives = process_markdown_content(post.content)
-        except Exception as e:
-            print(f'{CROSS} {MESSAGES["error"]["parsing_markdown"].format(file_path, e)}')
+            return pickle.loads((self.cache_dir / FILE_FRONTMATTER_CACHE).read_bytes())
+        except Exception:
+            return {}
+
+    def _save_frontmatter_cache(self) -> None:
+        """Persist parsed frontmatter for the files seen in this build"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / FILE_FRONTMATTER_CACHE).write_bytes(
+                pickle.dumps(self.frontmatter_seen, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+
+    def _prune_markdown_cache(self) -> None:
+        """Remove cached markdown output that no file of this build uses"""
+        used = {markdown_cache_name(body) for _, body in self.frontmatter_seen.values()}
+        try:
+            with os.scandir(self.markdown_cache_dir) as entries:
+                stale = [entry.path for entry in entries if entry.name not in used]
+        except OSError:
+            return
+
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _scan_markdown_files(self, directory: Path) -> List[os.DirEntry]:
+        """List markdown files in a directory without building Path objects per entry
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Directory entries for markdown files, in directory order
+        """
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries
+                    if entry.name.endswith(EXT_MD) and entry.is_file(follow_symlinks=False)]
+
+    def _load_markdown_files(self, entries: List[os.DirEntry]) -> List[Optional[Tuple[Dict, str, Dict[str, str], str]]]:
+        """Read and convert markdown files, across processes for larger sites
+
+        Frontmatter of files whose mtime and size are unchanged since the
+        previous build is taken from the cache instead of being re-parsed.
+        When the builder is reused after reset(), such files are not loaded
+        at all.
+
+        Args:
+            entries: Directory entries of markdown files
+
+        Returns:
+            List of load_markdown_file() results in the same order as entries
+        """
+        file_paths = [Path(entry.path) for entry in entries]
+        keys = []
+        for entry in entries:
+            try:
+                st = entry.stat()
+                keys.append((entry.path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                keys.append(None)
+        results = [self.loaded_cache.get(key) if key else None for key in keys]
+
+        # Files already loaded by a previous build of this builder are reused as-is
+        pending = [i for i, loaded in enumerate(results) if loaded is None]
+        pending_paths = [file_paths[i] for i in pending]
+        parsed = [self.frontmatter_cache.get(keys[i]) if keys[i] else None for i in pending]
+
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(pending_paths) < PARALLEL_MIN_FILES:
+            loaded_files = [load_markdown_file(file_path, self.markdown_cache_dir, cached)
+                            for file_path, cached in zip(pending_paths, parsed)]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Build the formatter's style tables before forking so workers inherit them
+            _get_formatter()
+            chunksize = max(1, len(pending_paths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                loaded_files = list(executor.map(load_markdown_file, pending_paths,
+                                                 itertools.repeat(self.markdown_cache_dir),
+                                                 parsed, chunksize=chunksize))
+
+        for i, loaded in zip(pending, loaded_files):
+            results[i] = loaded
+
+        for key, loaded in zip(keys, results):
+            if key and loaded is not None:
+                self.frontmatter_seen[key] = (loaded[0], loaded[3])
+                self.loaded_seen[key] = loaded
+
+        return results
+
+    def _build_page_data(self, file_path: Path, loaded: Optional[Tuple[Dict, str, Dict[str, str], str]],
+                         is_post: bool = True) -> Optional[PostData]:
+        """Build the post data record for a loaded markdown file
+
+        Args:
+            file_path: Path to markdown file
+            loaded: Result of load_markdown_file()
+            is_post: True for blog posts, False for pages
+
+        Returns:
+            PostData record or None if loading failed
+        """
+        if loaded is None:
             return None
 
-        return {
-            'content': content_html,
-            'title': post.get('title', ''),
-            'date': post.get('date', ''),
-            'comments': post.get('comments', path_defaults.get('comments', False)),
-            'mermaid': post.get('mermaid', path_defaults.get('mermaid', False)),
-            'codepen': post.get('codepen', path_defaults.get('codepen', False)),
-            'toc': post.get('toc', path_defaults.get('toc', is_post)),
-            'banner': post.get('banner', path_defaults.get('banner', False)),
-            'sidebar': post.get('sidebar', True),
-            'url': '',
-            'file_path': file_path,
-            'include_directives': include_directives
-        }
+        post, content_html, include_directives, _ = loaded
+        path_defaults = self._get_path_defaults(file_path)
+
+        return PostData(
+            content=content_html,
+            title=post.get('title', ''),
+            date=post.get('date', ''),
+            url='',
+            file_path=file_path,
+            comments=post.get('comments', path_defaults.get('comments', False)),
+            mermaid=post.get('mermaid', path_defaults.get('mermaid', False)),
+            codepen=post.get('codepen', path_defaults.get('codepen', False)),
+            toc=post.get('toc', path_defaults.get('toc', is_post)),
+            banner=post.get('banner', path_defaults.get('banner', False)),
+            sidebar=post.get('sidebar', True),
+            include_directives=include_directives
+        )
 
     def collect_posts(self) -> None:
         """Collect all posts from section directories"""
         content_dir = self.root_dir / DIR_CONTENT
         sections = self.config.get('sections', DEFAULT_CONFIG['sections'])
 
+        md_files = []
         for collection_name in sections:
             collection_dir = content_dir / collection_name
 
-            if not collection_dir.exists():
+            if not collection_dir.is_dir():
                 continue
 
-            for md_file in collection_dir.glob(f'*{EXT_MD}'):
-                post_data = self.parse_markdown_file(md_file)
+            md_files.extend((collection_name, entry) for entry in self._scan_markdown_files(collection_dir))
+
+        loaded_files = self._load_markdown_files([entry for _, entry in md_files])
 
-                if post_data is None:
-                    continue
+        for (collection_name, entry), loaded in zip(md_files, loaded_files):
+            md_file = Path(entry.path)
+            post_data = self._build_page_data(md_file, loaded)
 
-                post_slug = md_file.stem
-                post_data['url'] = f"/{collection_name}/{post_slug}/"
-                post_data['collection'] = collection_name
+            if post_data is None:
+                continue
+
+            post_slug = md_file.stem
+            post_data.url = f"/{collection_name}/{post_slug}/"
+            post_data.collection = collection_name
 
-                self.posts[collection_name].append(post_data)
+            self.posts[collection_name].append(post_data)
 
         # Sort posts by date (newest first)
         for collection in self.posts:
             self.posts[collection].sort(
-                key=lambda x: x.get('date', ''),
+                key=attrgetter('date'),
                 reverse=True
             )
+        self._all_posts_sorted = None
+        self._base_context = None
+        self._reset_rendered_includes()
 
     def collect_pages(self) -> None:
         """Collect all pages from sections directory"""
@@ -869,45 +1524,70 @@ class SiteBuilder:
             print(f'{CROSS} {MESSAGES["error"]["sections_not_found"].format(sections_dir)}')
             return
 
-        for page_file in sections_dir.glob(f'*{EXT_MD}'):
-            page_data = self.parse_markdown_file(page_file, is_post=False)
+        page_entries = self._scan_markdown_files(sections_dir)
+        loaded_files = self._load_markdown_files(page_entries)
+
+        for entry, loaded in zip(page_entries, loaded_files):
+            page_file = Path(entry.path)
+            page_data = self._build_page_data(page_file, loaded, is_post=False)
 
             if page_data is None:
                 continue
 
             if page_file.stem == 'home':
-                page_data['url'] = '/'
+                page_data.url = '/'
             else:
-                page_data['url'] = f"/{page_file.stem}/"
-                page_data['section'] = page_file.stem
+                page_data.url = f"/{page_file.stem}/"
+                page_data.section = page_file.stem
 
             self.pages.append(page_data)
 
-    def get_all_posts(self) -> List[Dict]:
-        """Get all posts combined from all sections
+        self._base_context = None
+
+    def _reset_rendered_includes(self) -> None:
+        """Forget rendered listing includes, they depend on the collected posts"""
+        self._rendered_posts_include = None
+        self._rendered_archive_include = None
+        self._rendered_category_by_section = {}
+
+    def get_all_posts(self) -> List[PostData]:
+        """Get all posts combined from all sections, memoized until posts are collected again
 
         Returns:
             List of all posts sorted by date
         """
-        all_posts = []
-        for collection in self.posts.values():
-            all_posts.extend(collection)
+        if self._all_posts_sorted is None:
+            all_posts = []
+            for collection in self.posts.values():
+                all_posts.extend(collection)
 
-        all_posts.sort(key=lambda x: x.get('date', ''), reverse=True)
-        return all_posts
+            all_posts.sort(key=attrgetter('date'), reverse=True)
+            self._all_posts_sorted = all_posts
+            self._top_posts = all_posts[:self.config.get('post_limit', DEFAULT_POST_LIMIT)]
+        return self._all_posts_sorted
+
+    def get_top_posts(self) -> List[PostData]:
+        """Get the latest posts shown on listing pages
+
+        Returns:
+            First post_limit posts sorted by date
+        """
+        self.get_all_posts()
+        return self._top_posts
 
-    def _process_include_directives(self, page_data: Dict) -> str:
+    def _process_include_directives(self, page_data: PostData) -> str:
         """Process include directives in page content
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Processed content with directives replaced
         """
-        content = page_data['content']
-        include_directives = page_data.get('include_directives', {})
+        content = page_data.content
+        include_directives = page_data.include_directives
 
+        rendered_map = {}
         for placeholder, directive_type in include_directives.items():
             if directive_type == 'posts':
                 rendered = self._render_posts_include()
@@ -921,78 +1601,103 @@ class SiteBuilder:
             else:
                 continue
 
-            content = content.replace(f'<p>{placeholder}</p>', rendered)
-            content = content.replace(placeholder, rendered)
+            rendered_map[placeholder] = rendered
+
+        if not rendered_map:
+            return content
+
+        if len(rendered_map) == 1:
+            placeholder, rendered = next(iter(rendered_map.items()))
+            return content.replace(f'<p>{placeholder}</p>', rendered).replace(placeholder, rendered)
 
-        return content
+        pattern = _placeholder_pattern(tuple(sorted(rendered_map)))
+        return pattern.sub(lambda m: rendered_map[m.group(1) or m.group(2)], content)
 
     def _render_posts_include(self) -> str:
-        """Render the posts include template
+        """Render the posts include template, once per build
 
         Returns:
             Rendered HTML string
         """
-        posts_template = self.env.get_template(TEMPLATE_POSTS)
-        return posts_template.render(
-            site=self.config,
-            posts=self.posts,
-            all_posts=self.get_all_posts()[:self.config.get('post_limit', DEFAULT_POST_LIMIT)]
-        )
+        if self._rendered_posts_include is None:
+            self._rendered_posts_include = self._tpl_posts.render(
+                site=self.config,
+                posts=self.posts,
+                all_posts=self.get_top_posts()
+            )
+        return self._rendered_posts_include
 
-    def _render_category_include(self, page_data: Dict) -> str:
+    def _render_category_include(self, page_data: PostData) -> str:
         """Render the category include template
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Rendered HTML string
         """
-        section_name = page_data.get('section')
+        section_name = page_data.section
         if not section_name:
-            section_name = normalize_url_path(page_data['url']).split('/')[-1]
-
-        page_data['section'] = section_name
-        category_template = self.env.get_template(TEMPLATE_CATEGORY)
-        return category_template.render(
-            site=self.config,
-            page=page_data,
-            posts=self.posts
-        )
+            section_name = normalize_url_path(page_data.url).split('/')[-1]
+
+        page_data.section = section_name
+
+        # The template only reads the section from the page
+        rendered = self._rendered_category_by_section.get(section_name)
+        if rendered is None:
+            rendered = self._rendered_category_by_section[section_name] = self._tpl_category.render(
+                site=self.config,
+                page=page_data,
+                posts=self.posts
+            )
+        return rendered
 
     def _render_archive_include(self) -> str:
-        """Render the archive include template
+        """Render the archive include template, once per build
 
         Returns:
             Rendered HTML string
         """
-        archive_template = self.env.get_template(TEMPLATE_ARCHIVE)
-        return archive_template.render(
-            site=self.config,
-            posts=self.posts,
-            all_posts=self.get_all_posts()
-        )
+        if self._rendered_archive_include is None:
+            self._rendered_archive_include = self._tpl_archive.render(
+                site=self.config,
+                posts=self.posts,
+                all_posts=self.get_all_posts()
+            )
+        return self._rendered_archive_include
 
-    def _build_template_context(self, page_data: Dict) -> Dict:
+    def _build_template_context(self, page_data: PostData) -> Dict:
         """Build template rendering context
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Context dictionary for template rendering
         """
+        if self._base_context is None:
+            self._base_context = self._build_base_context()
+
+        context = self._base_context.copy()
+        context['page'] = page_data
+        return context
+
+    def _build_base_context(self) -> Dict:
+        """Build the template context fields shared by every page of a build
+
+        Returns:
+            Context dictionary without the page entry
+        """
         assets_config = self.config.get('assets', {})
         images_config = assets_config.get('images', {})
         logo_file = images_config.get('logo', 'codeCraft.ico')
         favicon_file = images_config.get('favicon', 'codeCraft.ico')
 
         return {
-            'page': page_data,
             'site': self.config,
             'posts': self.posts,
             'pages': self.pages,
-            'all_posts': self.get_all_posts()[:self.config.get('post_limit', DEFAULT_POST_LIMIT)],
+            'all_posts': self.get_top_posts(),
             'use_base_tag': True,
             'base_url': self.base_url,
             'domain': f"https://{self.config['base']['url']}",
@@ -1002,64 +1707,215 @@ class SiteBuilder:
             'js': "/assets/codeCraft.js",
             'logo': f"/assets/{logo_file}",
             'favicon': f"/assets/{favicon_file}",
-            'asset_urls': self.asset_urls,
-            'now': datetime.now()
+            'asset_urls': self.asset_urls
         }
 
-    def render_page(self, page_data: Dict, output_path: str) -> None:
+    def _compute_deps_hash(self) -> str:
+        """Hash the inputs shared by every page: builder, templates, config and date
+
+        Returns:
+            Hex digest of the global build dependencies
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(Path(__file__).read_bytes())
+        for template_file in sorted(self.templates_dir.rglob('*')):
+            if template_file.is_file():
+                digest.update(str(template_file.relative_to(self.templates_dir)).encode('utf-8'))
+                digest.update(template_file.read_bytes())
+        digest.update(repr(self.config).encode('utf-8'))
+        digest.update(date.today().isoformat().encode('ascii'))
+        return digest.hexdigest()
+
+    def _prepare_output_dir(self) -> None:
+        """Reuse the previous output directory when it is known from the build manifest
+
+        With unchanged global dependencies unchanged pages are skipped. Otherwise
+        every page is rendered again, but existing files are only rewritten when
+        their bytes differ. Without a manifest the output directory starts clean.
+        """
+        self.deps_hash = self._compute_deps_hash()
+        try:
+            manifest = json.loads((self.cache_dir / FILE_BUILD_MANIFEST).read_bytes())
+        except (OSError, ValueError):
+            manifest = {}
+
+        outputs = manifest.get('outputs')
+        if isinstance(outputs, dict) and self.output_dir.exists():
+            if manifest.get('deps') == self.deps_hash:
+                self.manifest = outputs
+            else:
+                self.manifest = dict.fromkeys(outputs)
+        else:
+            self.manifest = {}
+            self.clean_output_dir()
+
+    def _compute_listing_hashes(self) -> None:
+        """Hash the collected pages and posts that appear on other pages"""
+        listing = hashlib.blake2b(digest_size=16)
+        for page in self.pages:
+            listing.update(repr((page.url, page.title, page.sidebar)).encode('utf-8'))
+        self._listing_hash = listing.digest()
+
+        posts = hashlib.blake2b(digest_size=16)
+        for post in self.get_all_posts():
+            posts.update(repr((post.collection, post.url, post.title, post.date)).encode('utf-8'))
+            posts.update(post.content.encode('utf-8'))
+        self._posts_hash = posts.digest()
+
+    def _page_key(self, page_data: PostData) -> str:
+        """Hash everything a page renders from, before include directives are expanded
+
+        Args:
+            page_data: Page data record
+
+        Returns:
+            Hex digest identifying the page's rendered output
+        """
+        # Every page's context exposes the posts, not only pages with listing includes
+        digest = hashlib.blake2b(self._listing_hash + self._posts_hash, digest_size=16)
+        digest.update(repr(page_data).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _finish_manifest(self) -> None:
+        """Remove pages that are no longer produced and record this build's outputs"""
+        for output_path in self.manifest.keys() - self.rendered_outputs.keys():
+            output_file = self.output_dir / output_path / 'index.html'
+            try:
+                output_file.unlink()
+                output_file.parent.rmdir()
+            except OSError:
+                pass
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / FILE_BUILD_MANIFEST).write_bytes(
+                dump_json({'deps': self.deps_hash, 'outputs': self.rendered_outputs}))
+        except OSError:
+            pass
+
+    def render_page(self, page_data: PostData, output_path: str) -> None:
         """Render a single page using template
 
+        Pages whose inputs match the previous build are not rendered again,
+        as long as their output file is still the one written by that build.
+
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
             output_path: Output path relative to build directory
         """
-        template = self.env.get_template(TEMPLATE_MAIN)
+        from markupsafe import Markup
+
+        output_file = self.output_dir / output_path / 'index.html'
+        page_key = self._page_key(page_data)
 
-        # Process include directives
-        page_data['content'] = self._process_include_directives(page_data)
+        # Process include directives, the result is trusted markdown output
+        if page_data.include_directives:
+            page_data.content = Markup(self._process_include_directives(page_data))
+        else:
+            page_data.content = Markup(page_data.content)
+
+        previous = self.manifest.get(output_path)
+        if previous and previous[0] == page_key:
+            try:
+                st = os.stat(output_file)
+                if [st.st_size, st.st_mtime_ns] == previous[1:]:
+                    self.rendered_outputs[output_path] = previous
+                    return
+            except OSError:
+                pass
 
         # Build context and render
         context = self._build_template_context(page_data)
-        html = template.render(**context)
+        html = self._tpl_main.render(**context)
 
         # Write output
-        output_file = self.output_dir / output_path / 'index.html'
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        if output_file.parent not in self._created_dirs:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_file.parent)
+
+        write_if_changed(output_file, html.encode('utf-8'))
+
+        st = os.stat(output_file)
+        self.rendered_outputs[output_path] = [page_key, st.st_size, st.st_mtime_ns]
+
+    def render_pages(self, jobs: List[Tuple[PostData, str]]) -> None:
+        """Render pages, across processes for larger sites
+
+        Args:
+            jobs: List of (page data, output path) pairs
+        """
+        # Create every output directory up front, once per unique path
+        for output_dir in {self.output_dir / output_path for _, output_path in jobs} - self._created_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
+
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(jobs) < PARALLEL_MIN_FILES:
+            for page_data, output_path in jobs:
+                self.render_page(page_data, output_path)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        state = (self.config_path, self.build_now, self.posts, self.pages, self.manifest, self._created_dirs,
+                 self._listing_hash, self._posts_hash)
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(state,)) as executor:
+            results = executor.map(_render_page_worker, [page_data for page_data, _ in jobs],
+                                   [output_path for _, output_path in jobs], chunksize=chunksize)
+            for (page_data, output_path), (rendered, content) in zip(jobs, results):
+                self.rendered_outputs[output_path] = rendered
+                page_data.content = content
 
     def generate_feed(self) -> None:
         """Generate RSS feed"""
-        template = self.env.get_template(FILE_FEED)
-
         context = {
             'site': self.config,
-            'posts': self.get_all_posts()[:FEED_POST_LIMIT],
-            'now': datetime.now()
+            'posts': self.get_all_posts()[:FEED_POST_LIMIT]
         }
 
-        feed_xml = template.render(**context)
-
-        with open(self.output_dir / FILE_FEED, 'w', encoding='utf-8') as f:
-            f.write(feed_xml)
+        # Stream straight to disk instead of building the whole document in memory
+        stream = self._tpl_feed.stream(**context)
+        stream.enable_buffering(size=16)
+        stream.dump(str(self.output_dir / FILE_FEED), encoding='utf-8')
 
     def generate_search_index(self) -> None:
-        """Generate search.json for client-side search"""
-        template = self.env.get_template(FILE_SEARCH)
+        """Generate search.json for client-side search
 
-        context = {
-            'site': self.config,
-            'posts': self.get_all_posts()
-        }
+        The index is serialized directly. Sites that customize the index schema
+        can set search_template in the config to render the theme's search.json
+        template instead.
+        """
+        from markupsafe import Markup
 
-        search_json = template.render(**context)
+        if self.config.get('search_template', DEFAULT_CONFIG['search_template']):
+            stream = self.env.get_template(FILE_SEARCH).stream(site=self.config, posts=self.get_all_posts())
+            stream.enable_buffering(size=16)
+            stream.dump(str(self.output_dir / FILE_SEARCH), encoding='utf-8')
+            return
+
+        folder = f"/{self.config['base']['folder']}"
+        search_index = [
+            {
+                'doc': str(post.title),
+                'title': str(post.title),
+                'content': Markup(post.content).striptags()[:SEARCH_CONTENT_LENGTH],
+                'url': f"{folder}/{post.url}",
+                'relUrl': post.url,
+            }
+            for post in self.get_all_posts()
+        ]
 
-        with open(self.output_dir / FILE_SEARCH, 'w', encoding='utf-8') as f:
-            f.write(search_json)
+        write_if_changed(self.output_dir / FILE_SEARCH, dump_json(search_index))
 
     def generate_css(self) -> None:
-        """Generate CSS from template with font configurations"""
+        """Generate CSS from template with font configurations
+
+        The rendered stylesheet is cached by font configuration and template
+        source, so unchanged inputs skip the template render and the cached
+        file is copied straight into the output directory.
+        """
         assets_config = self.config.get('assets', {})
         fonts_config = assets_config.get('fonts', [])
 
@@ -1070,49 +1926,86 @@ class SiteBuilder:
             font_data['weight_num'] = FONT_WEIGHT_MAP.get(weight_str, '400')
             fonts.append(font_data)
 
-        template = self.env.get_template(FILE_CSS_TEMPLATE)
-        css_content = template.render(fonts=fonts)
+        template_stat = os.stat(self._tpl_css.filename)
+        key = hashlib.blake2b(
+            repr((fonts, template_stat.st_mtime_ns, template_stat.st_size)).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cache_file = self.cache_dir / DIR_CSS_CACHE / f'{key}{EXT_CSS}'
 
         assets_dst = self.output_dir / DIR_ASSETS
         assets_dst.mkdir(parents=True, exist_ok=True)
 
-        with open(assets_dst / FILE_CODECRAFT_CSS, 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        if not cache_file.is_file():
+            css_bytes = self._tpl_css.render(fonts=fonts).encode('utf-8')
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(css_bytes)
+            except OSError:
+                write_if_changed(assets_dst / FILE_CODECRAFT_CSS, css_bytes)
+                return
+
+        # Copied file to file, without reading the stylesheet into memory
+        copy_if_changed(str(cache_file), str(assets_dst / FILE_CODECRAFT_CSS))
 
     def clean_output_dir(self) -> None:
-        """Remove and recreate the output directory"""
+        """Replace the output directory with an empty one
+
+        The old tree is renamed aside and deleted in a background thread, so
+        the unlinks overlap with collecting posts instead of delaying the build.
+        Trees left behind by interrupted builds are removed in the same pass.
+        """
         if self.output_dir.exists():
-            shutil.rmtree(self.output_dir)
+            trash = self.output_dir.with_name(f'_{self.output_dir.name}.old.{os.getpid()}')
+            try:
+                os.replace(self.output_dir, trash)
+            except OSError:
+                shutil.rmtree(self.output_dir)
+
+        stale = list(self.output_dir.parent.glob(f'_{self.output_dir.name}.old.*'))
+        if stale:
+            import threading
+
+            def remove_trees():
+                for tree in stale:
+                    shutil.rmtree(tree, ignore_errors=True)
+
+            threading.Thread(target=remove_trees, daemon=True).start()
+
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def copy_static_files(self) -> None:
         """Copy static assets to output directory"""
-        # Copy theme assets (excluding CSS template)
+        # Mirror theme assets, removing deleted ones (the stylesheet is generated below)
         assets_src = self.theme_dir / DIR_ASSETS
         if assets_src.exists():
-            assets_dst = self.output_dir / DIR_ASSETS
-            assets_dst.mkdir(parents=True, exist_ok=True)
-
-            for item in assets_src.iterdir():
-                if item.name != FILE_CODECRAFT_CSS:
-                    if item.is_file():
-                        shutil.copy2(item, assets_dst / item.name)
-                    elif item.is_dir():
-                        shutil.copytree(item, assets_dst / item.name, dirs_exist_ok=True)
+            sync_tree(assets_src, self.output_dir / DIR_ASSETS, exclude=(FILE_CODECRAFT_CSS,))
 
         # Copy examples directory if it exists
         examples_src = self.root_dir / 'examples'
         if examples_src.exists():
-            examples_dst = self.output_dir / 'examples'
-            if examples_dst.exists():
-                shutil.rmtree(examples_dst)
-            shutil.copytree(examples_src, examples_dst)
+            sync_tree(examples_src, self.output_dir / 'examples')
 
         # Generate CSS from template
         self.generate_css()
 
+    def emit_local_variants(self) -> None:
+        """Mirror the output directory into the local dev server tree
+
+        The dev server serves this tree as-is, so the <base> tag, absolute
+        URLs and console suppression are rewritten once here instead of on
+        every request. Only serve and watch call this, production builds
+        never need the local tree.
+        """
+        sync_tree(self.output_dir, self.root_dir / DIR_BUILD_LOCAL, copy_function=copy_local_variant)
+
     def build(self) -> None:
         """Build the entire site"""
+        from tqdm import tqdm
+
+        # One timestamp for every page and the feed
+        self.build_now = self.env.globals['now'] = datetime.now()
+
         steps = MESSAGES['info']["build_steps"]
         step = -1
 
@@ -1127,27 +2020,22 @@ class SiteBuilder:
 
         with tqdm(total=len(steps), desc="Building site", unit="step", ncols=80,
                   bar_format="{l_bar}{bar} {n_fmt}/{total_fmt} [{elapsed}]") as progress:
-            self.clean_output_dir()
+            self._prepare_output_dir()
             progress_step()
 
             self.collect_posts()
             self.collect_pages()
+            self._compute_listing_hashes()
             progress_step()
 
             total_posts = sum(len(posts) for posts in self.posts.values())
-            if total_posts > 0:
-                for collection_name, posts in self.posts.items():
-                    for post in posts:
-                        output_path = normalize_url_path(post['url'])
-                        self.render_page(post, output_path)
+            self.render_pages([(post, normalize_url_path(post.url))
+                               for posts in self.posts.values() for post in posts])
             progress_step()
 
-            for page in self.pages:
-                if page['url'] == '/':
-                    output_path = ''
-                else:
-                    output_path = normalize_url_path(page['url'])
-                self.render_page(page, output_path)
+            # Pages render after posts so listing includes see processed post content
+            self.render_pages([(page, '' if page.url == '/' else normalize_url_path(page.url))
+                               for page in self.pages])
             progress_step()
 
             self.generate_feed()
@@ -1155,12 +2043,54 @@ class SiteBuilder:
             progress_step()
 
             self.copy_static_files()
+            self._finish_manifest()
+            self._save_frontmatter_cache()
+            self._prune_markdown_cache()
             progress_step()
 
         print(f"{CHECK} {MESSAGES['info']['build_complete']}")
         print(f"{INFO} {MESSAGES['info']['build_stats'].format(total_posts, len(self.pages))}")
 
 
+# Per-process builder used by render workers, Jinja environments cannot be pickled
+_RENDER_BUILDER: Optional[SiteBuilder] = None
+
+
+def _init_render_worker(state: Tuple) -> None:
+    """Create the worker's site builder from the parent's collected state
+
+    Args:
+        state: Tuple of (config path, build time, posts, pages, manifest,
+            created directories, listing hash, posts hash)
+    """
+    global _RENDER_BUILDER
+    config_path, build_now, posts, pages, manifest, created_dirs, listing_hash, posts_hash = state
+
+    builder = SiteBuilder(config_path)
+    builder.build_now = builder.env.globals['now'] = build_now
+    builder.posts = posts
+    builder.pages = pages
+    builder.manifest = manifest
+    builder._created_dirs = created_dirs
+    builder._listing_hash = listing_hash
+    builder._posts_hash = posts_hash
+    _RENDER_BUILDER = builder
+
+
+def _render_page_worker(page_data: PostData, output_path: str) -> Tuple[List, str]:
+    """Render one page in a worker process
+
+    Args:
+        page_data: Page data record
+        output_path: Output path relative to build directory
+
+    Returns:
+        Tuple of (manifest entry, content with include directives processed)
+    """
+    _RENDER_BUILDER.render_page(page_data, output_path)
+    return _RENDER_BUILDER.rendered_outputs[output_path], page_data.content
+
+
 # ============================================================================
 # CLI INTERFACE
 # ============================================================================
@@ -1171,6 +2101,7 @@ class BlogCLI:
     def __init__(self):
         """Initialize the CLI"""
         self.root_dir = Path(__file__).parent
+        self._builder: Optional[SiteBuilder] = None
 
     def build(self, args: argparse.Namespace) -> None:
         """Build the site
@@ -1178,8 +2109,30 @@ class BlogCLI:
         Args:
             args: Command-line arguments
         """
-        builder = SiteBuilder()
-        builder.build()
+        if getattr(args, 'clean_cache', False):
+            cache_dir = self.root_dir / DIR_CACHE
+            if cache_dir.exists():
+                shutil.rmtree(cache_dir)
+
+        self._builder = SiteBuilder()
+        self._builder.build()
+
+    def build_incremental(self, changed_paths: List[str]) -> None:
+        """Rebuild after changes, reusing the previous builder when only content changed
+
+        Markdown edits reuse the loaded configuration, templates and unchanged
+        files. Any other change, such as templates, config or this script,
+        gets a full build with a fresh builder.
+
+        Args:
+            changed_paths: Paths reported by the file watcher
+        """
+        if self._builder is None or not all(path.endswith(EXT_MD) for path in changed_paths):
+            self._builder = SiteBuilder()
+        else:
+            self._builder.reset()
+        self._builder.build()
+        self._builder.emit_local_variants()
 
     def serve(self, args: argparse.Namespace) -> None:
         """Start local development server
@@ -1188,12 +2141,14 @@ class BlogCLI:
             args: Command-line arguments
         """
         port = args.port
-        site_dir = self.root_dir / DIR_BUILD
+        site_dir = self.root_dir / DIR_BUILD_LOCAL
 
-        if not site_dir.exists():
+        builder = SiteBuilder()
+        if not builder.output_dir.exists():
             print(MESSAGES['info']['building_site'])
-            builder = SiteBuilder()
             builder.build()
+        # Refresh the local tree on every start, unchanged files cost a single stat
+        builder.emit_local_variants()
 
         site_dir_abs = str(site_dir.resolve())
 
@@ -1203,14 +2158,29 @@ class BlogCLI:
         print(f"   {MESSAGES['info']['server_stop_hint']}")
 
         import http.server
+        import mimetypes
         import socketserver
 
         class RewritingHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             """HTTP handler that rewrites paths for local development"""
 
+            # Content types by extension, filled on first request for each extension
+            _mime_cache: ClassVar[Dict[str, str]] = {}
+
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, directory=site_dir_abs, **kwargs)
 
+            def guess_type(self, path) -> str:
+                """Guess a file's content type, memoized by extension"""
+                ext = os.path.splitext(path)[1].lower()
+                mime_type = self._mime_cache.get(ext)
+                if mime_type is None:
+                    mime_type = super().guess_type(path)
+                    # Compression suffixes depend on the inner extension, so they are not cached
+                    if ext not in mimetypes.encodings_map:
+                        self._mime_cache[ext] = mime_type
+                return mime_type
+
             def log_error(self, format: str, *args) -> None:
                 """Suppress broken pipe errors"""
                 if args and len(args) > 0:
@@ -1219,18 +2189,16 @@ class BlogCLI:
                 super().log_error(format, *args)
 
             def send_head(self):
-                """Override to handle HTML rewriting"""
+                """Serve pre-rewritten files, disabling caching for HTML"""
                 path = self.translate_path(self.path)
                 f = None
 
                 # Handle directory index
                 if os.path.isdir(path):
-                    parts = urllib.parse.urlsplit(self.path)
-                    if not parts.path.endswith('/'):
+                    url_path, sep, query = self.path.partition('?')
+                    if not url_path.endswith('/'):
                         self.send_response(301)
-                        new_parts = (parts[0], parts[1], parts[2] + '/', parts[3], parts[4])
-                        new_url = urllib.parse.urlunsplit(new_parts)
-                        self.send_header("Location", new_url)
+                        self.send_header("Location", f"{url_path}/{sep}{query}")
                         self.end_headers()
                         return None
 
@@ -1247,47 +2215,29 @@ class BlogCLI:
                     return None
 
                 try:
-                    content = f.read()
-                    f.close()
-
-                    # Rewrite HTML content
-                    if path.endswith(EXT_HTML) and (b'<html' in content or b'<!DOCTYPE' in content):
-                        content = re.sub(PATTERN_BASE_TAG, b'', content)
-                        # Rewrite absolute URLs to relative for local development
-                        content = content.replace(b'https://lucianofedericopereira.github.io/codecraft/', b'/')
-                        content = content.replace(b'./assets/', b'/assets/')
-                        content = content.replace(b'"./examples/', b'"/examples/')
-                        content = content.replace(b"'examples/", b"'/examples/")
-                        content = re.sub(
-                            PATTERN_CONSOLE_SUPPRESS,
-                            b'// Console suppression disabled for local development\n\n        ',
-                            content,
-                            flags=re.DOTALL
-                        )
-
-                    # Rewrite JavaScript content
-                    elif path.endswith(EXT_JS):
-                        content = content.replace(b'`examples/${', b'`/examples/${')
-
-                    # Send response
+                    fs = os.fstat(f.fileno())
                     self.send_response(200)
                     self.send_header("Content-type", self.guess_type(path))
-                    self.send_header("Content-Length", str(len(content)))
+                    self.send_header("Content-Length", str(fs.st_size))
                     if path.endswith(EXT_HTML):
                         self.send_header('Cache-Control', 'no-store')
                     self.end_headers()
 
-                    return io.BytesIO(content)
+                    return f
 
                 except Exception as e:
-                    if f:
-                        f.close()
+                    f.close()
                     self.send_error(500, f"Internal error: {e}")
                     return None
 
-        class RewritingTCPServer(socketserver.TCPServer):
-            """TCP server with address reuse enabled"""
+            def copyfile(self, source, outputfile) -> None:
+                """Send file bodies with socket.sendfile, which uses os.sendfile where available"""
+                self.connection.sendfile(source)
+
+        class RewritingTCPServer(socketserver.ThreadingTCPServer):
+            """Threaded TCP server with address reuse enabled, so page assets load concurrently"""
             allow_reuse_address = True
+            daemon_threads = True
 
         try:
             with RewritingTCPServer(("", port), RewritingHTTPRequestHandler) as httpd:
@@ -1315,23 +2265,44 @@ class BlogCLI:
         print(f"   {MESSAGES['info']['server_stop_hint']}")
 
         self.build(args)
+        self._builder.emit_local_variants()
 
         wm = pyinotify.WatchManager()
         mask = pyinotify.IN_MODIFY | pyinotify.IN_CREATE | pyinotify.IN_DELETE
 
+        import threading
+
         class EventHandler(pyinotify.ProcessEvent):
-            """File system event handler"""
+            """File system event handler that debounces rebuilds"""
 
             def __init__(self, cli: BlogCLI, args: argparse.Namespace):
                 self.cli = cli
                 self.args = args
+                self._pending_timer: Optional[threading.Timer] = None
+                self._pending_paths: List[str] = []
+                self._build_lock = threading.Lock()
+
+            def _rebuild(self) -> None:
+                """Run one rebuild, never overlapping a rebuild still in progress"""
+                with self._build_lock:
+                    changed_paths, self._pending_paths = self._pending_paths, []
+                    print(f"   {MESSAGES['info']['rebuilding']}")
+                    self.cli.build_incremental(changed_paths)
 
             def process_default(self, event):
                 """Handle file system events"""
-                if not event.pathname.startswith(str(self.cli.root_dir / DIR_BUILD)):
-                    print(f"\n{MESSAGES['info']['change_detected'].format(event.pathname)}")
-                    print(f"   {MESSAGES['info']['rebuilding']}")
-                    self.cli.build(self.args)
+                if event.pathname.startswith(str(self.cli.root_dir / DIR_BUILD)):
+                    return
+                if event.pathname.endswith(WATCH_IGNORED_SUFFIXES):
+                    return
+
+                print(f"\n{MESSAGES['info']['change_detected'].format(event.pathname)}")
+                self._pending_paths.append(event.pathname)
+                if self._pending_timer is not None:
+                    self._pending_timer.cancel()
+                self._pending_timer = threading.Timer(WATCH_DEBOUNCE_SECONDS, self._rebuild)
+                self._pending_timer.daemon = True
+                self._pending_timer.start()
 
         handler = EventHandler(self, args)
         notifier = pyinotify.Notifier(wm, handler)
@@ -1363,12 +2334,22 @@ class BlogCLI:
         print(MESSAGES['info']['cleaning'])
 
         build_dir = self.root_dir / DIR_BUILD
+        build_local_dir = self.root_dir / DIR_BUILD_LOCAL
+        cache_dir = self.root_dir / DIR_CACHE
         pycache = self.root_dir / DIR_PYCACHE
 
         if build_dir.exists():
             shutil.rmtree(build_dir)
             print(f"  {MESSAGES['info']['removed'].format(build_dir)}")
 
+        if build_local_dir.exists():
+            shutil.rmtree(build_local_dir)
+            print(f"  {MESSAGES['info']['removed'].format(build_local_dir)}")
+
+        if cache_dir.exists():
+            shutil.rmtree(cache_dir)
+            print(f"  {MESSAGES['info']['removed'].format(cache_dir)}")
+
         if pycache.exists():
             shutil.rmtree(pycache)
             print(f"  {MESSAGES['info']['removed'].format(pycache)}")
@@ -1458,6 +2439,11 @@ def main() -> None:
         'build',
         help=MESSAGES["help"]["build"],
     )
+    build_parser.add_argument(
+        '--clean-cache',
+        action='store_true',
+        help=MESSAGES["help"]["clean_cache"]
+    )
 
     # Serve command
     serve_parser = subparsers.add_parser(
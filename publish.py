@@ -5,20 +5,27 @@ Handles site building and publishing for the CodeCraft static site generator
 """
 from __future__ import annotations
 
-import copy
+import argparse
+import functools
+import hashlib
+import html
+import itertools
+import json
+import os
+import pickle
 import re
 import shutil
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import frontmatter
-import yaml
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
-from markdown import markdown
-from pygments import highlight
-from pygments.formatters import HtmlFormatter
-from pygments.lexers import get_lexer_by_name
+# Heavy dependencies are imported where they are used, so --help and builds
+# whose markdown is fully cached start without loading them
+if TYPE_CHECKING:
+    from jinja2 import Environment
+    from pygments.formatters import HtmlFormatter
 
 # ============================================================================
 # CONSTANTS - Configuration and Magic Values
@@ -34,12 +41,19 @@ MONTHS = {
 # Directory names
 DIR_ASSETS = 'assets'
 DIR_BUILD = 'build'
+DIR_CACHE = '.codecraft-cache'
+DIR_JINJA_CACHE = 'publish-jinja'
+DIR_MARKDOWN_CACHE = 'publish-md'
 DIR_SECTIONS = 'sections'
 DIR_CONTENT = 'content'
 DIR_TEMPLATES = 'templates'
 DIR_THEMES = 'themes'
 
+# File extensions
+EXT_MD = '.md'
+
 # File names
+FILE_BUILD_MANIFEST = 'publish_manifest.json'
 FILE_CONFIG_PATH = 'themes/config.yaml'
 FILE_CSS_TEMPLATE = 'codeCraft.css'
 FILE_CODECRAFT_CSS = 'codeCraft.css'
@@ -49,6 +63,9 @@ FILE_SEARCH = 'search.json'
 # Markdown configuration
 MD_EXTENSIONS = ['extra', 'toc']
 
+# Bump to invalidate cached markdown output after processing changes
+MARKDOWN_CACHE_VERSION = b'1'
+
 # CSS classes
 CSS_CLASS_HIGHLIGHT = 'highlight'
 CSS_CLASS_HIGHLIGHTER_ROUGE = 'highlighter-rouge'
@@ -56,14 +73,32 @@ CSS_CLASS_LANGUAGE_PLAINTEXT = 'language-plaintext highlighter-rouge'
 CSS_CLASS_LANGUAGE_MERMAID = 'language-mermaid'
 
 # Regex patterns
-PATTERN_MERMAID_BLOCK = r'```mermaid\n(.*?)```'
-PATTERN_CODE_BLOCK = r'```(\w+)?\n(.*?)```'
+PATTERN_MERMAID_BLOCK = r'^```mermaid\n(.*?)^```'
+PATTERN_CODE_BLOCK = r'^```(\w+)?\n(.*?)^```'
 PATTERN_EXAMPLE_SHORTCODE = r'\[example:(\d+)\]'
+PATTERN_INCLUDE_DIRECTIVE = r'\{%-?\s*include\s+(posts|category|archive)\.html\s*-?%\}'
+
+# Compiled regexes
+_RE_BLOCKS = re.compile(
+    f'(?P<mermaid>{PATTERN_MERMAID_BLOCK})'
+    f'|(?P<code>{PATTERN_CODE_BLOCK})'
+    f'|(?P<example>{PATTERN_EXAMPLE_SHORTCODE})'
+    f'|(?P<include>{PATTERN_INCLUDE_DIRECTIVE})',
+    re.DOTALL | re.MULTILINE
+)
+_RE_INLINE_CODE = re.compile(r'<code>(?!</code>)')
+_RE_MERMAID_RESTORE = re.compile(r'<p>MERMAID_PLACEHOLDER_(\d+)</p>')
+_RE_FM_BOUNDARY = re.compile(r'^-{3,}\s*$', re.MULTILINE)
 
 # Include directive placeholders
 PLACEHOLDER_POSTS = 'INCLUDE_POSTS_PLACEHOLDER'
 PLACEHOLDER_CATEGORY = 'INCLUDE_CATEGORY_PLACEHOLDER'
 PLACEHOLDER_ARCHIVE = 'INCLUDE_ARCHIVE_PLACEHOLDER'
+INCLUDE_PLACEHOLDERS = {
+    'posts': PLACEHOLDER_POSTS,
+    'category': PLACEHOLDER_CATEGORY,
+    'archive': PLACEHOLDER_ARCHIVE,
+}
 
 # Template names
 TEMPLATE_MAIN = 'codeCraft.html'
@@ -74,6 +109,20 @@ TEMPLATE_ARCHIVE = 'archive.html'
 # Post limits
 DEFAULT_POST_LIMIT = 10
 FEED_POST_LIMIT = 10
+SEARCH_CONTENT_LENGTH = 200
+
+# Frontmatter feature defaults before path rules apply
+PATH_DEFAULT_FEATURES = {
+    'toc': False,
+    'comments': False,
+    'mermaid': False,
+    'codepen': False,
+    'banner': False
+}
+
+# Minimum number of files before conversion and rendering use a process pool. Each render
+# worker builds its own SiteBuilder, which only pays off on sites with hundreds of files
+PARALLEL_MIN_FILES = 200
 
 # Font weight mappings
 FONT_WEIGHT_MAP = {
@@ -92,6 +141,7 @@ FONT_WEIGHT_MAP = {
 DEFAULT_CONFIG = {
     "post_limit": DEFAULT_POST_LIMIT,
     "search_enabled": False,
+    "search_template": False,
     "base": {
         "url": "localhost",
         "folder": ""
@@ -118,6 +168,33 @@ DEFAULT_CONFIG = {
 }
 
 
+# ============================================================================
+# DATA CLASSES
+# ============================================================================
+
+@dataclass(slots=True)
+class PostData:
+    """Represents a blog post or page with its metadata"""
+    content: str
+    title: str
+    date: str
+    url: str
+    file_path: Path
+    comments: bool = False
+    mermaid: bool = False
+    codepen: bool = False
+    toc: bool = False
+    banner: bool = False
+    sidebar: bool = True
+    collection: str = ""
+    section: str = ""
+    include_directives: Dict[str, str] = None
+
+    def __post_init__(self):
+        if self.include_directives is None:
+            self.include_directives = {}
+
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -132,17 +209,21 @@ def apply_defaults(data: Optional[Dict], defaults: Dict) -> Dict:
     Returns:
         Merged dictionary with defaults applied
     """
-    def deep_merge(target: Dict, source: Dict) -> Dict:
+    merged_data = dict(data) if data else {}
+
+    # Only dicts that receive defaults are copied, so data is never mutated
+    stack = [(merged_data, defaults)]
+    while stack:
+        target, source = stack.pop()
         for key, value in source.items():
             if isinstance(value, dict):
-                node = target.setdefault(key, {})
-                deep_merge(node, value)
+                node = dict(target[key]) if key in target else {}
+                target[key] = node
+                stack.append((node, value))
             else:
                 target.setdefault(key, value)
-        return target
 
-    merged_data = copy.deepcopy(data) if data else {}
-    return deep_merge(merged_data, defaults)
+    return merged_data
 
 
 def strip_all_whitespace(value: str) -> str:
@@ -154,7 +235,7 @@ def strip_all_whitespace(value: str) -> str:
     Returns:
         String with all whitespace removed
     """
-    return re.sub(r'\s+', '', value)
+    return ''.join(value.split())
 
 
 def normalize_url_path(path: str) -> str:
@@ -173,6 +254,7 @@ def normalize_url_path(path: str) -> str:
 # DATE FORMATTING FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def format_month_year(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM date string to abbreviated month + year
 
@@ -193,6 +275,7 @@ def format_month_year(date_str: str, lang: str = "en") -> str:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date_archive(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM-DD date string to 3-letter month + padded day
 
@@ -217,6 +300,7 @@ def format_date_archive(date_str: str, lang: str = "en") -> str:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_year(date_str: str) -> str:
     """Extract year from YYYY-MM-DD date string
 
@@ -234,6 +318,7 @@ def extract_year(date_str: str) -> str:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_date_full(date_str: str, lang: str = "en") -> str:
     """Format YYYY-MM-DD date string to 3-letter month + padded day + year
 
@@ -258,6 +343,22 @@ def format_date_full(date_str: str, lang: str = "en") -> str:
         return str(date_str)
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD string, memoized since templates format the same dates repeatedly
+
+    Args:
+        value: Date string
+
+    Returns:
+        Parsed datetime or None if the string is not a valid date
+    """
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except Exception:
+        return None
+
+
 def format_date_jinja(value: Any, format: str = '%B %d, %Y') -> str:
     """Format date for Jinja2 templates
 
@@ -268,12 +369,11 @@ def format_date_jinja(value: Any, format: str = '%B %d, %Y') -> str:
     Returns:
         Formatted date string
     """
-    from datetime import date
     if isinstance(value, str):
-        try:
-            value = datetime.strptime(value, '%Y-%m-%d')
-        except Exception:
+        parsed = _parse_iso_date(value)
+        if parsed is None:
             return value
+        value = parsed
     if isinstance(value, (datetime, date)):
         return value.strftime(format)
     return value
@@ -283,115 +383,111 @@ def format_date_jinja(value: Any, format: str = '%B %d, %Y') -> str:
 # MARKDOWN PROCESSING
 # ============================================================================
 
-def extract_include_directives(content: str) -> Tuple[str, Dict[str, str]]:
-    """Extract Jinja include directives and replace with placeholders
+def restore_mermaid_blocks(content_html: str, mermaid_blocks: List[str]) -> str:
+    """Restore mermaid blocks with proper language class
 
     Args:
-        content: Markdown content with include directives
+        content_html: HTML content with placeholders
+        mermaid_blocks: List of mermaid block contents
 
     Returns:
-        Tuple of (modified content, directives dict)
+        HTML with restored mermaid blocks
     """
-    include_directives = {}
+    if not mermaid_blocks:
+        return content_html
 
-    # Posts include
-    if '{%- include posts.html -%}' in content or '{% include posts.html %}' in content:
-        include_directives[PLACEHOLDER_POSTS] = 'posts'
-        content = content.replace('{%- include posts.html -%}', PLACEHOLDER_POSTS)
-        content = content.replace('{% include posts.html %}', PLACEHOLDER_POSTS)
+    def restore_mermaid(match):
+        index = int(match.group(1))
+        if index >= len(mermaid_blocks):
+            return match.group(0)
+        return f'<pre><code class="{CSS_CLASS_LANGUAGE_MERMAID}">{mermaid_blocks[index]}</code></pre>'
 
-    # Category include
-    if '{%- include category.html -%}' in content or '{% include category.html %}' in content:
-        include_directives[PLACEHOLDER_CATEGORY] = 'category'
-        content = content.replace('{%- include category.html -%}', PLACEHOLDER_CATEGORY)
-        content = content.replace('{% include category.html %}', PLACEHOLDER_CATEGORY)
+    return _RE_MERMAID_RESTORE.sub(restore_mermaid, content_html)
 
-    # Archive include
-    if '{%- include archive.html -%}' in content or '{% include archive.html %}' in content:
-        include_directives[PLACEHOLDER_ARCHIVE] = 'archive'
-        content = content.replace('{%- include archive.html -%}', PLACEHOLDER_ARCHIVE)
-        content = content.replace('{% include archive.html %}', PLACEHOLDER_ARCHIVE)
 
-    return content, include_directives
-
-
-def extract_example_shortcodes(content: str, directives: Dict[str, str]) -> str:
-    """Replace [example:N] shortcodes with placeholders
-
-    Args:
-        content: Markdown content
-        directives: Dictionary to store directive mappings
+@functools.lru_cache(maxsize=1)
+def _get_formatter() -> HtmlFormatter:
+    """Create the shared Pygments formatter, its options never vary between code blocks
 
     Returns:
-        Content with placeholders
+        HtmlFormatter instance
     """
-    def replace_example(match):
-        example_id = match.group(1)
-        placeholder = f'EXAMPLE_PLACEHOLDER_{example_id}'
-        directives[placeholder] = f'example:{example_id}'
-        return f'\n\n{placeholder}\n\n'
+    from pygments.formatters import HtmlFormatter
+    return HtmlFormatter(cssclass=CSS_CLASS_HIGHLIGHT, noclasses=False)
 
-    return re.sub(PATTERN_EXAMPLE_SHORTCODE, replace_example, content)
 
-
-def extract_mermaid_blocks(content: str) -> Tuple[str, List[str]]:
-    """Extract mermaid blocks and replace with placeholders
+@functools.lru_cache(maxsize=64)
+def _get_lexer(lang: str):
+    """Look up a Pygments lexer by language name, memoized per language
 
     Args:
-        content: Markdown content
+        lang: Language name from the code fence
 
     Returns:
-        Tuple of (content with placeholders, list of mermaid blocks)
+        Lexer instance, or None if no lexer matches the name
     """
-    mermaid_blocks = []
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
 
-    def save_mermaid(match):
-        mermaid_blocks.append(match.group(1))
-        return f'\n\nMERMAID_PLACEHOLDER_{len(mermaid_blocks)-1}\n\n'
+    try:
+        return get_lexer_by_name(lang, stripall=False)
+    except ClassNotFound:
+        return None
 
-    content = re.sub(PATTERN_MERMAID_BLOCK, save_mermaid, content, flags=re.DOTALL)
-    return content, mermaid_blocks
 
-
-def restore_mermaid_blocks(content_html: str, mermaid_blocks: List[str]) -> str:
-    """Restore mermaid blocks with proper language class
+def highlight_code(lang: str, code: str) -> str:
+    """Highlight a single fenced code block with Pygments
 
     Args:
-        content_html: HTML content with placeholders
-        mermaid_blocks: List of mermaid block contents
+        lang: Language name from the code fence
+        code: Code block contents
 
     Returns:
-        HTML with restored mermaid blocks
+        Highlighted HTML, or a plain code block if the language is unknown
     """
-    for i, mermaid_content in enumerate(mermaid_blocks):
-        content_html = content_html.replace(
-            f'<p>MERMAID_PLACEHOLDER_{i}</p>',
-            f'<pre><code class="{CSS_CLASS_LANGUAGE_MERMAID}">{mermaid_content}</code></pre>'
-        )
-    return content_html
+    lexer = _get_lexer(lang)
+    if lexer is not None:
+        from pygments import highlight
+        highlighted = highlight(code, lexer, _get_formatter())
+        return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}">{highlighted}</div>'
+    return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}"><div class="{CSS_CLASS_HIGHLIGHT}"><pre><code class="language-{lang}">{html.escape(code)}</code></pre></div></div>'
+
 
+def preprocess_markdown(content: str) -> Tuple[str, Dict[str, str], List[str]]:
+    """Extract directives and mermaid blocks and highlight code blocks
 
-def highlight_code_blocks(content: str) -> str:
-    """Process fenced code blocks with Pygments syntax highlighting
+    Include directives, example shortcodes, mermaid blocks and fenced code
+    blocks are matched by one regex, so the content is scanned once instead
+    of once per construct.
 
     Args:
-        content: Markdown content with fenced code blocks
+        content: Raw markdown content
 
     Returns:
-        Content with highlighted code blocks
+        Tuple of (content with placeholders and highlighted code, directives dict, list of mermaid blocks)
     """
-    def highlight_match(match):
-        lang = match.group(1) or 'text'
-        code = match.group(2)
-        try:
-            lexer = get_lexer_by_name(lang, stripall=False)
-            formatter = HtmlFormatter(cssclass=CSS_CLASS_HIGHLIGHT, noclasses=False)
-            highlighted = highlight(code, lexer, formatter)
-            return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}">{highlighted}</div>'
-        except:
-            return f'<div class="{CSS_CLASS_HIGHLIGHTER_ROUGE}"><div class="{CSS_CLASS_HIGHLIGHT}"><pre><code class="language-{lang}">{code}</code></pre></div></div>'
+    directives = {}
+    mermaid_blocks = []
 
-    return re.sub(PATTERN_CODE_BLOCK, highlight_match, content, flags=re.DOTALL)
+    def replace_block(match):
+        kind = match.lastgroup
+        if kind == 'mermaid':
+            mermaid_blocks.append(match.group(2))
+            return f'\n\nMERMAID_PLACEHOLDER_{len(mermaid_blocks)-1}\n\n'
+        if kind == 'code':
+            return highlight_code(match.group(4) or 'text', match.group(5))
+        if kind == 'example':
+            example_id = match.group(7)
+            placeholder = f'EXAMPLE_PLACEHOLDER_{example_id}'
+            directives[placeholder] = f'example:{example_id}'
+            return f'\n\n{placeholder}\n\n'
+        directive_type = match.group(9)
+        placeholder = INCLUDE_PLACEHOLDERS[directive_type]
+        directives[placeholder] = directive_type
+        return placeholder
+
+    content = _RE_BLOCKS.sub(replace_block, content)
+    return content, directives, mermaid_blocks
 
 
 def add_inline_code_classes(content_html: str) -> str:
@@ -403,11 +499,7 @@ def add_inline_code_classes(content_html: str) -> str:
     Returns:
         HTML with classes added to inline code
     """
-    return re.sub(
-        r'<code>(?!</code>)',
-        f'<code class="{CSS_CLASS_LANGUAGE_PLAINTEXT}">',
-        content_html
-    )
+    return _RE_INLINE_CODE.sub(f'<code class="{CSS_CLASS_LANGUAGE_PLAINTEXT}">', content_html)
 
 
 def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
@@ -419,19 +511,11 @@ def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
     Returns:
         Tuple of (processed HTML, include directives dict)
     """
-    # Extract include directives
-    content, include_directives = extract_include_directives(content)
-
-    # Extract example shortcodes
-    content = extract_example_shortcodes(content, include_directives)
-
-    # Extract mermaid blocks
-    content, mermaid_blocks = extract_mermaid_blocks(content)
-
-    # Highlight code blocks
-    content = highlight_code_blocks(content)
+    # Extract directives and mermaid blocks, highlight code blocks
+    content, include_directives, mermaid_blocks = preprocess_markdown(content)
 
     # Convert markdown to HTML
+    from markdown import markdown
     content_html = markdown(content, extensions=MD_EXTENSIONS, extension_configs={})
 
     # Add classes to inline code
@@ -443,6 +527,195 @@ def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
     return content_html, include_directives
 
 
+def markdown_cache_name(body: str) -> str:
+    """Name the cache file holding the processed output of a markdown body
+
+    Args:
+        body: Raw markdown content
+
+    Returns:
+        Cache file name derived from the content hash
+    """
+    return hashlib.blake2b(MARKDOWN_CACHE_VERSION + body.encode('utf-8'), digest_size=16).hexdigest() + '.pkl'
+
+
+def md_to_html_cached(body: str, cache_dir: Path) -> Tuple[str, Dict[str, str]]:
+    """Process markdown content, reusing cached output for unchanged bodies
+
+    Args:
+        body: Raw markdown content
+        cache_dir: Directory holding cached results keyed by content hash
+
+    Returns:
+        Tuple of (processed HTML, include directives dict)
+    """
+    cache_file = cache_dir / markdown_cache_name(body)
+
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            # Corrupt or truncated entry, convert again and replace it
+            cache_file.unlink(missing_ok=True)
+
+    result = process_markdown_content(body)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml_loader():
+    """Pick the fastest available safe YAML loader
+
+    Returns:
+        yaml.CSafeLoader when libyaml is available, otherwise yaml.SafeLoader
+    """
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
+    return YamlLoader
+
+
+def split_frontmatter(text: str) -> Tuple[Dict, str]:
+    """Split a markdown document into its YAML frontmatter and body
+
+    Follows python-frontmatter's YAML handling: the document must open with a
+    --- boundary, and both the document and the body are stripped.
+
+    Args:
+        text: Markdown document
+
+    Returns:
+        Tuple of (metadata dictionary, markdown body)
+    """
+    import yaml
+
+    text = text.strip()
+    if not _RE_FM_BOUNDARY.match(text):
+        return {}, text
+
+    parts = _RE_FM_BOUNDARY.split(text, 2)
+    if len(parts) < 3:
+        return {}, text
+
+    metadata = yaml.load(parts[1], Loader=_get_yaml_loader())
+    return (metadata if isinstance(metadata, dict) else {}), parts[2].strip()
+
+
+def load_markdown_file(file_path: Path, cache_dir: Path) -> Optional[Tuple[Dict, str, Dict[str, str], str]]:
+    """Read a markdown file, split off its frontmatter and convert the body
+
+    Args:
+        file_path: Path to markdown file
+        cache_dir: Directory holding cached markdown output
+
+    Returns:
+        Tuple of (frontmatter metadata, processed HTML, include directives dict, markdown body)
+        or None on error
+    """
+    try:
+        # One bulk decode instead of the incremental text-mode reader
+        with open(file_path, 'rb') as f:
+            text = f.read().decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        metadata, body = split_frontmatter(text)
+    except Exception:
+        return None
+
+    try:
+        content_html, include_directives = md_to_html_cached(body, cache_dir)
+    except Exception:
+        return None
+
+    return metadata, content_html, include_directives, body
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data to UTF-8 encoded JSON, using orjson when installed
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, ensure_ascii=False).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def prune_tree(src: Path, dst: Path, keep: Tuple[str, ...] = ()) -> None:
+    """Remove files and directories under dst that no longer exist under src
+
+    Args:
+        src: Source directory
+        dst: Destination directory mirroring src
+        keep: Top-level file names in dst that are not removed
+    """
+    for dirpath, dirnames, filenames in os.walk(dst, topdown=False):
+        rel_dir = os.path.relpath(dirpath, dst)
+        src_dir = src / rel_dir
+        for name in filenames:
+            if rel_dir == '.' and name in keep:
+                continue
+            if not (src_dir / name).is_file():
+                os.remove(os.path.join(dirpath, name))
+        for name in dirnames:
+            if not (src_dir / name).is_dir():
+                shutil.rmtree(os.path.join(dirpath, name), ignore_errors=True)
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to a file unless it already holds exactly those bytes
+
+    Args:
+        path: Output file path
+        data: Encoded file contents
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.stat(path).st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
+@functools.lru_cache(maxsize=128)
+def _placeholder_pattern(placeholders: Tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern matching any placeholder, bare or wrapped in a paragraph
+
+    Args:
+        placeholders: Placeholder strings
+
+    Returns:
+        Compiled pattern, group 1 for a wrapped placeholder and group 2 for a bare one
+    """
+    # Longest first so EXAMPLE_PLACEHOLDER_10 is not matched as EXAMPLE_PLACEHOLDER_1
+    alternation = '|'.join(map(re.escape, sorted(placeholders, key=len, reverse=True)))
+    return re.compile(f'<p>({alternation})</p>|({alternation})')
+
+
 # ============================================================================
 # SITE BUILDER
 # ============================================================================
@@ -450,31 +723,59 @@ def process_markdown_content(content: str) -> Tuple[str, Dict[str, str]]:
 class SiteBuilder:
     """Main site builder class that handles all build operations"""
 
-    def __init__(self, config_path: str = FILE_CONFIG_PATH):
+    def __init__(self, config_path: str = FILE_CONFIG_PATH, incremental: bool = True):
         """Initialize the site builder
 
         Args:
             config_path: Path to config file
+            incremental: Reuse unchanged pages from the previous build
         """
         self.root_dir = Path(__file__).parent
+        self.incremental = incremental
+        self.build_now = datetime.now()
+        self.config_path = config_path
         self.config = self._load_config(config_path)
+        self._path_rules = self._compile_path_rules()
         self.output_dir = self.root_dir / DIR_BUILD
+        self.cache_dir = self.root_dir / DIR_CACHE
+        self.markdown_cache_dir = self.cache_dir / DIR_MARKDOWN_CACHE
         self.theme_dir = self.root_dir / DIR_THEMES
         self.templates_dir = self.theme_dir / DIR_TEMPLATES
 
         # Set base URL
         self.base_url = self._build_base_url()
 
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment and resolve templates once per build
         self.env = self._create_jinja_environment()
-
-        # Resolve asset URLs
+        self._tpl_main = self.env.get_template(TEMPLATE_MAIN)
+        self._tpl_posts = self.env.get_template(TEMPLATE_POSTS)
+        self._tpl_category = self.env.get_template(TEMPLATE_CATEGORY)
+        self._tpl_archive = self.env.get_template(TEMPLATE_ARCHIVE)
+        self._tpl_feed = self.env.get_template(FILE_FEED)
+        self._tpl_css = self.env.get_template(FILE_CSS_TEMPLATE)
+
+        # Resolve asset URLs and stylesheet fonts
         self.asset_urls = self._get_asset_urls()
+        self.fonts = self._resolve_fonts()
 
         # Storage for posts and pages
         sections = self.config.get('sections', [])
         self.posts = {name: [] for name in sections} if sections else {'design': [], 'code': [], 'projects': []}
         self.pages = []
+        self._all_posts_sorted = None
+        self._top_posts = None
+        self._base_context = None
+
+        # Incremental build state: output path -> [page hash, output size, output mtime_ns]
+        self.deps_hash = ''
+        self.manifest = {}
+        self.rendered_outputs = {}
+        self.markdown_used = set()
+        self._created_dirs = set()
+        self.previous_css = None
+        self.css_output = None
+        self._listing_hash = b''
+        self._posts_hash = b''
 
     def _load_config(self, config_path: str) -> Dict:
         """Load configuration from YAML file
@@ -485,13 +786,15 @@ class SiteBuilder:
         Returns:
             Configuration dictionary
         """
+        import yaml
+
         config_file = self.root_dir / config_path
         config = {}
 
         if config_file.exists():
             try:
                 with open(config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_get_yaml_loader())
                     config = config if config else {}
             except Exception:
                 config = {}
@@ -518,9 +821,18 @@ class SiteBuilder:
         Returns:
             Configured Jinja2 Environment
         """
+        from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+        # Compiled templates persist on disk so later builds skip parsing. Kept apart
+        # from codecraft.py's cache, whose autoescape settings compile differently
+        bytecode_dir = self.cache_dir / DIR_JINJA_CACHE
+        bytecode_dir.mkdir(parents=True, exist_ok=True)
+
         env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False,
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_dir), '%s.cache')
         )
 
         # Add custom filters
@@ -547,6 +859,24 @@ class SiteBuilder:
             'mermaid': f"https://cdn.jsdelivr.net/npm/mermaid@{scripts.get('mermaid', '11.4.1')}/+esm"
         }
 
+    def _resolve_fonts(self) -> List[Dict]:
+        """Resolve configured fonts with their numeric CSS weights
+
+        Returns:
+            List of font dictionaries with weight_num added
+        """
+        assets_config = self.config.get('assets', {})
+        fonts_config = assets_config.get('fonts', [])
+
+        fonts = []
+        for font in fonts_config:
+            font_data = font.copy()
+            weight_str = font.get('weight', 'Regular').lower()
+            font_data['weight_num'] = FONT_WEIGHT_MAP.get(weight_str, '400')
+            fonts.append(font_data)
+
+        return fonts
+
     def _get_path_defaults(self, file_path: Path) -> Dict[str, bool]:
         """Get default frontmatter values for a file path based on config rules
 
@@ -556,94 +886,142 @@ class SiteBuilder:
         Returns:
             Dictionary of default values
         """
-        rules_config = self.config.get('rules', [])
         file_path_str = str(file_path)
+        defaults = PATH_DEFAULT_FEATURES.copy()
 
-        defaults = {
-            'toc': False,
-            'comments': False,
-            'mermaid': False,
-            'codepen': False,
-            'banner': False
-        }
+        for scope_path, features in self._path_rules:
+            if scope_path in file_path_str:
+                defaults.update(features)
 
-        for rule in rules_config:
-            scope = rule.get('scope', {})
-            scope_path = scope.get('path', '')
+        return defaults
 
-            if scope_path and scope_path in file_path_str:
-                if 'features' in rule:
-                    defaults.update(rule['features'])
+    def _compile_path_rules(self) -> List[Tuple[str, Dict]]:
+        """Reduce config rules to the (scope path, features) pairs that can apply
 
-        return defaults
+        Returns:
+            List of (scope path, features) tuples in config order
+        """
+        path_rules = []
+        for rule in self.config.get('rules', []):
+            scope_path = rule.get('scope', {}).get('path', '')
+            if scope_path and 'features' in rule:
+                path_rules.append((scope_path, rule['features']))
+        return path_rules
+
+    def _build_post_data(self, file_path: Path, loaded: Tuple[Dict, str, Dict[str, str], str]) -> PostData:
+        """Build the post data record for a loaded markdown file
 
-    def parse_markdown_file(self, file_path: Path, is_post: bool = True) -> Optional[Dict]:
+        Args:
+            file_path: Path to markdown file
+            loaded: Result of load_markdown_file()
+
+        Returns:
+            PostData record
+        """
+        post, content_html, include_directives, _ = loaded
+
+        # Frontmatter overrides path defaults, which always carry every feature key
+        features = {**self._get_path_defaults(file_path), **post}
+
+        return PostData(
+            content=content_html,
+            title=post.get('title', ''),
+            date=post.get('date', ''),
+            url='',
+            file_path=file_path,
+            comments=features['comments'],
+            mermaid=features['mermaid'],
+            codepen=features['codepen'],
+            toc=features['toc'],
+            banner=features['banner'],
+            sidebar=post.get('sidebar', True),
+            include_directives=include_directives
+        )
+
+    def parse_markdown_file(self, file_path: Path) -> Optional[PostData]:
         """Parse a markdown file with frontmatter
 
         Args:
             file_path: Path to markdown file
-            is_post: True for blog posts, False for pages
 
         Returns:
-            Dictionary with post data or None on error
+            PostData record or None on error
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                post = frontmatter.load(f)
-        except Exception:
-            return None
+        return self.parse_markdown_files([file_path])[0]
 
-        path_defaults = self._get_path_defaults(file_path)
+    def parse_markdown_files(self, file_paths: List[Path]) -> List[Optional[PostData]]:
+        """Parse and convert markdown files, across processes for larger sites
 
-        try:
-            content_html, include_directives = process_markdown_content(post.content)
-        except Exception:
-            return None
+        Args:
+            file_paths: Paths to markdown files
 
-        return {
-            'content': content_html,
-            'title': post.get('title', ''),
-            'date': post.get('date', ''),
-            'comments': post.get('comments', path_defaults.get('comments', False)),
-            'mermaid': post.get('mermaid', path_defaults.get('mermaid', False)),
-            'codepen': post.get('codepen', path_defaults.get('codepen', False)),
-            'toc': post.get('toc', path_defaults.get('toc', is_post)),
-            'banner': post.get('banner', path_defaults.get('banner', False)),
-            'sidebar': post.get('sidebar', True),
-            'url': '',
-            'file_path': file_path,
-            'include_directives': include_directives
-        }
+        Returns:
+            List of PostData records (None on error) in the same order as file_paths
+        """
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(file_paths) < PARALLEL_MIN_FILES:
+            loaded_files = [load_markdown_file(file_path, self.markdown_cache_dir) for file_path in file_paths]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # Build the formatter's style tables before forking so workers inherit them
+            _get_formatter()
+            chunksize = max(1, len(file_paths) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                loaded_files = list(executor.map(load_markdown_file, file_paths,
+                                                 itertools.repeat(self.markdown_cache_dir), chunksize=chunksize))
+
+        self.markdown_used.update(markdown_cache_name(loaded[3]) for loaded in loaded_files if loaded is not None)
+
+        return [None if loaded is None else self._build_post_data(file_path, loaded)
+                for file_path, loaded in zip(file_paths, loaded_files)]
+
+    def _scan_markdown_files(self, directory: Path) -> List[Path]:
+        """List markdown files in a directory from a single scandir pass
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Paths of markdown files, in directory order
+        """
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.endswith(EXT_MD) and entry.is_file()]
 
     def collect_posts(self) -> None:
         """Collect all posts from section directories"""
         content_dir = self.root_dir / DIR_CONTENT
         sections = self.config.get('sections', DEFAULT_CONFIG['sections'])
 
+        md_files = []
         for collection_name in sections:
             collection_dir = content_dir / collection_name
 
             if not collection_dir.exists():
                 continue
 
-            for md_file in collection_dir.glob('*.md'):
-                post_data = self.parse_markdown_file(md_file)
+            md_files.extend((collection_name, md_file) for md_file in self._scan_markdown_files(collection_dir))
+
+        parsed = self.parse_markdown_files([md_file for _, md_file in md_files])
 
-                if post_data is None:
-                    continue
+        collected = []
+        for (collection_name, md_file), post_data in zip(md_files, parsed):
+            if post_data is None:
+                continue
 
-                post_slug = md_file.stem
-                post_data['url'] = f"{collection_name}/{post_slug}/"
-                post_data['collection'] = collection_name
+            post_slug = md_file.stem
+            post_data.url = f"{collection_name}/{post_slug}/"
+            post_data.collection = collection_name
 
-                self.posts[collection_name].append(post_data)
+            collected.append(post_data)
 
-        # Sort posts by date (newest first)
-        for collection in self.posts:
-            self.posts[collection].sort(
-                key=lambda x: x.get('date', ''),
-                reverse=True
-            )
+        # Sort posts by date (newest first) in one pass, splitting them up keeps each collection sorted
+        collected.sort(key=attrgetter('date'), reverse=True)
+        for post_data in collected:
+            self.posts[post_data.collection].append(post_data)
+        self._all_posts_sorted = None
+        self._base_context = None
 
     def collect_pages(self) -> None:
         """Collect all pages from sections directory"""
@@ -652,45 +1030,61 @@ class SiteBuilder:
         if not sections_dir.exists():
             return
 
-        for page_file in sections_dir.glob('*.md'):
-            page_data = self.parse_markdown_file(page_file, is_post=False)
+        page_files = self._scan_markdown_files(sections_dir)
+        parsed = self.parse_markdown_files(page_files)
 
+        for page_file, page_data in zip(page_files, parsed):
             if page_data is None:
                 continue
 
             if page_file.stem == 'home':
-                page_data['url'] = '/'
+                page_data.url = '/'
             else:
-                page_data['url'] = f"{page_file.stem}/"
-                page_data['section'] = page_file.stem
+                page_data.url = f"{page_file.stem}/"
+                page_data.section = page_file.stem
 
             self.pages.append(page_data)
 
-    def get_all_posts(self) -> List[Dict]:
-        """Get all posts combined from all sections
+        self._base_context = None
+
+    def get_all_posts(self) -> List[PostData]:
+        """Get all posts combined from all sections, memoized until posts are collected again
 
         Returns:
             List of all posts sorted by date
         """
-        all_posts = []
-        for collection in self.posts.values():
-            all_posts.extend(collection)
+        if self._all_posts_sorted is None:
+            all_posts = []
+            for collection in self.posts.values():
+                all_posts.extend(collection)
 
-        all_posts.sort(key=lambda x: x.get('date', ''), reverse=True)
-        return all_posts
+            all_posts.sort(key=attrgetter('date'), reverse=True)
+            self._all_posts_sorted = all_posts
+            self._top_posts = all_posts[:self.config.get('post_limit', DEFAULT_POST_LIMIT)]
+        return self._all_posts_sorted
+
+    def get_top_posts(self) -> List[PostData]:
+        """Get the latest posts shown on listing pages
+
+        Returns:
+            First post_limit posts sorted by date
+        """
+        self.get_all_posts()
+        return self._top_posts
 
-    def _process_include_directives(self, page_data: Dict) -> str:
+    def _process_include_directives(self, page_data: PostData) -> str:
         """Process include directives in page content
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Processed content with directives replaced
         """
-        content = page_data['content']
-        include_directives = page_data.get('include_directives', {})
+        content = page_data.content
+        include_directives = page_data.include_directives
 
+        rendered_map = {}
         for placeholder, directive_type in include_directives.items():
             if directive_type == 'posts':
                 rendered = self._render_posts_include()
@@ -704,10 +1098,17 @@ class SiteBuilder:
             else:
                 continue
 
-            content = content.replace(f'<p>{placeholder}</p>', rendered)
-            content = content.replace(placeholder, rendered)
+            rendered_map[placeholder] = rendered
 
-        return content
+        if not rendered_map:
+            return content
+
+        if len(rendered_map) == 1:
+            placeholder, rendered = next(iter(rendered_map.items()))
+            return content.replace(f'<p>{placeholder}</p>', rendered).replace(placeholder, rendered)
+
+        pattern = _placeholder_pattern(tuple(sorted(rendered_map)))
+        return pattern.sub(lambda m: rendered_map[m.group(1) or m.group(2)], content)
 
     def _render_posts_include(self) -> str:
         """Render the posts include template
@@ -715,29 +1116,27 @@ class SiteBuilder:
         Returns:
             Rendered HTML string
         """
-        posts_template = self.env.get_template(TEMPLATE_POSTS)
-        return posts_template.render(
+        return self._tpl_posts.render(
             site=self.config,
             posts=self.posts,
-            all_posts=self.get_all_posts()[:self.config.get('post_limit', DEFAULT_POST_LIMIT)]
+            all_posts=self.get_top_posts()
         )
 
-    def _render_category_include(self, page_data: Dict) -> str:
+    def _render_category_include(self, page_data: PostData) -> str:
         """Render the category include template
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Rendered HTML string
         """
-        section_name = page_data.get('section')
+        section_name = page_data.section
         if not section_name:
-            section_name = normalize_url_path(page_data['url']).split('/')[-1]
+            section_name = normalize_url_path(page_data.url).split('/')[-1]
 
-        page_data['section'] = section_name
-        category_template = self.env.get_template(TEMPLATE_CATEGORY)
-        return category_template.render(
+        page_data.section = section_name
+        return self._tpl_category.render(
             site=self.config,
             page=page_data,
             posts=self.posts
@@ -749,33 +1148,44 @@ class SiteBuilder:
         Returns:
             Rendered HTML string
         """
-        archive_template = self.env.get_template(TEMPLATE_ARCHIVE)
-        return archive_template.render(
+        return self._tpl_archive.render(
             site=self.config,
             posts=self.posts,
             all_posts=self.get_all_posts()
         )
 
-    def _build_template_context(self, page_data: Dict) -> Dict:
+    def _build_template_context(self, page_data: PostData) -> Dict:
         """Build template rendering context
 
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
 
         Returns:
             Context dictionary for template rendering
         """
+        if self._base_context is None:
+            self._base_context = self._build_base_context()
+
+        context = self._base_context.copy()
+        context['page'] = page_data
+        return context
+
+    def _build_base_context(self) -> Dict:
+        """Build the template context fields shared by every page of a build
+
+        Returns:
+            Context dictionary without the page entry
+        """
         assets_config = self.config.get('assets', {})
         images_config = assets_config.get('images', {})
         logo_file = images_config.get('logo', 'codeCraft.ico')
         favicon_file = images_config.get('favicon', 'codeCraft.ico')
 
         return {
-            'page': page_data,
             'site': self.config,
             'posts': self.posts,
             'pages': self.pages,
-            'all_posts': self.get_all_posts()[:self.config.get('post_limit', DEFAULT_POST_LIMIT)],
+            'all_posts': self.get_top_posts(),
             'use_base_tag': True,
             'base_url': self.base_url,
             'domain': f"https://{self.config['base']['url']}",
@@ -786,81 +1196,245 @@ class SiteBuilder:
             'logo': f"./assets/{logo_file}",
             'favicon': f"./assets/{favicon_file}",
             'asset_urls': self.asset_urls,
-            'now': datetime.now()
+            'now': self.build_now
         }
 
-    def render_page(self, page_data: Dict, output_path: str) -> None:
+    def _compute_deps_hash(self) -> str:
+        """Hash the inputs shared by every page: builder, templates, config and date
+
+        Returns:
+            Hex digest of the global build dependencies
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(Path(__file__).read_bytes())
+        for template_file in sorted(self.templates_dir.rglob('*')):
+            if template_file.is_file():
+                digest.update(str(template_file.relative_to(self.templates_dir)).encode('utf-8'))
+                digest.update(template_file.read_bytes())
+        digest.update(repr(self.config).encode('utf-8'))
+        digest.update(date.today().isoformat().encode('ascii'))
+        return digest.hexdigest()
+
+    def _prepare_output_dir(self) -> None:
+        """Reuse the previous output directory when it is known from the build manifest
+
+        With unchanged global dependencies unchanged pages are skipped, otherwise
+        every page is rendered again. Without a manifest, or when incremental
+        builds are disabled, the output directory starts clean.
+        """
+        self.deps_hash = self._compute_deps_hash()
+        manifest = {}
+        if self.incremental:
+            try:
+                manifest = json.loads((self.cache_dir / FILE_BUILD_MANIFEST).read_bytes())
+            except (OSError, ValueError):
+                pass
+
+        outputs = manifest.get('outputs')
+        if isinstance(outputs, dict) and self.output_dir.exists():
+            if manifest.get('deps') == self.deps_hash:
+                self.manifest = outputs
+                self.previous_css = manifest.get('css')
+            else:
+                self.manifest = dict.fromkeys(outputs)
+            (self.output_dir / '.nojekyll').touch()
+        else:
+            self.manifest = {}
+            self.clean_output_dir()
+
+    def _compute_listing_hashes(self) -> None:
+        """Hash the collected pages and posts that appear on other pages"""
+        listing = hashlib.blake2b(digest_size=16)
+        for page in self.pages:
+            listing.update(repr((page.url, page.title, page.sidebar)).encode('utf-8'))
+        self._listing_hash = listing.digest()
+
+        posts = hashlib.blake2b(digest_size=16)
+        for post in self.get_all_posts():
+            posts.update(repr((post.collection, post.url, post.title, post.date)).encode('utf-8'))
+            posts.update(post.content.encode('utf-8'))
+        self._posts_hash = posts.digest()
+
+    def _page_key(self, page_data: PostData) -> str:
+        """Hash everything a page renders from, before include directives are expanded
+
+        Args:
+            page_data: Page data record
+
+        Returns:
+            Hex digest identifying the page's rendered output
+        """
+        # Every page's context exposes the posts, not only pages with listing includes
+        digest = hashlib.blake2b(self._listing_hash + self._posts_hash, digest_size=16)
+        digest.update(repr(page_data).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _finish_manifest(self) -> None:
+        """Remove pages that are no longer produced and record this build's outputs"""
+        for output_path in self.manifest.keys() - self.rendered_outputs.keys():
+            output_file = self.output_dir / output_path / 'index.html'
+            try:
+                output_file.unlink()
+                output_file.parent.rmdir()
+            except OSError:
+                pass
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / FILE_BUILD_MANIFEST).write_text(
+                json.dumps({'deps': self.deps_hash, 'outputs': self.rendered_outputs, 'css': self.css_output}),
+                encoding='utf-8')
+        except OSError:
+            pass
+
+    def _prune_markdown_cache(self) -> None:
+        """Remove cached markdown output that no file of this build uses"""
+        try:
+            with os.scandir(self.markdown_cache_dir) as entries:
+                stale = [entry.path for entry in entries if entry.name not in self.markdown_used]
+        except OSError:
+            return
+
+        for path in stale:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def render_page(self, page_data: PostData, output_path: str) -> None:
         """Render a single page using template
 
+        Pages whose inputs match the previous build are not rendered again,
+        as long as their output file is still the one written by that build.
+
         Args:
-            page_data: Page data dictionary
+            page_data: Page data record
             output_path: Output path relative to build directory
         """
-        template = self.env.get_template(TEMPLATE_MAIN)
+        output_file = self.output_dir / output_path / 'index.html'
+        page_key = self._page_key(page_data)
 
         # Process include directives
-        page_data['content'] = self._process_include_directives(page_data)
+        page_data.content = self._process_include_directives(page_data)
+
+        previous = self.manifest.get(output_path)
+        if previous and previous[0] == page_key:
+            try:
+                st = os.stat(output_file)
+                if [st.st_size, st.st_mtime_ns] == previous[1:]:
+                    self.rendered_outputs[output_path] = previous
+                    return
+            except OSError:
+                pass
 
         # Build context and render
         context = self._build_template_context(page_data)
-        html = template.render(**context)
+        html = self._tpl_main.render(**context)
 
-        # Write output
-        output_file = self.output_dir / output_path / 'index.html'
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write output, leaving files that already hold the same page untouched
+        if output_file.parent not in self._created_dirs:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_file.parent)
+
+        write_if_changed(output_file, html.encode('utf-8'))
+
+        st = os.stat(output_file)
+        self.rendered_outputs[output_path] = [page_key, st.st_size, st.st_mtime_ns]
+
+    def render_pages(self, jobs: List[Tuple[PostData, str]]) -> None:
+        """Render pages, across processes for larger sites
+
+        Args:
+            jobs: List of (page data, output path) pairs
+        """
+        # Create every output directory up front, once per unique path
+        for output_dir in {self.output_dir / output_path for _, output_path in jobs} - self._created_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
+
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(jobs) < PARALLEL_MIN_FILES:
+            for page_data, output_path in jobs:
+                self.render_page(page_data, output_path)
+            return
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html)
+        from concurrent.futures import ProcessPoolExecutor
+
+        state = (self.config_path, self.build_now, self.posts, self.pages, self.manifest, self._created_dirs,
+                 self._listing_hash, self._posts_hash)
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(state,)) as executor:
+            results = executor.map(_render_page_worker, [page_data for page_data, _ in jobs],
+                                   [output_path for _, output_path in jobs], chunksize=chunksize)
+            for (page_data, output_path), (rendered, content) in zip(jobs, results):
+                self.rendered_outputs[output_path] = rendered
+                page_data.content = content
 
     def generate_feed(self) -> None:
         """Generate RSS feed"""
-        template = self.env.get_template(FILE_FEED)
-
         context = {
             'site': self.config,
             'posts': self.get_all_posts()[:FEED_POST_LIMIT],
-            'now': datetime.now()
+            'now': self.build_now
         }
 
-        feed_xml = template.render(**context)
-
-        with open(self.output_dir / FILE_FEED, 'w', encoding='utf-8') as f:
-            f.write(feed_xml)
+        stream = self._tpl_feed.stream(**context)
+        stream.enable_buffering(size=16)
+        stream.dump(str(self.output_dir / FILE_FEED), encoding='utf-8')
 
     def generate_search_index(self) -> None:
-        """Generate search.json for client-side search"""
-        template = self.env.get_template(FILE_SEARCH)
+        """Generate search.json for client-side search
 
-        context = {
-            'site': self.config,
-            'posts': self.get_all_posts()
-        }
+        The index is serialized directly. Sites that customize the index schema
+        can set search_template in the config to render the theme's search.json
+        template instead.
+        """
+        from markupsafe import Markup
+
+        if self.config.get('search_template', DEFAULT_CONFIG['search_template']):
+            stream = self.env.get_template(FILE_SEARCH).stream(site=self.config, posts=self.get_all_posts())
+            stream.enable_buffering(size=16)
+            stream.dump(str(self.output_dir / FILE_SEARCH), encoding='utf-8')
+            return
 
-        search_json = template.render(**context)
+        folder = f"/{self.config['base']['folder']}"
+        search_index = [
+            {
+                'doc': str(post.title),
+                'title': str(post.title),
+                'content': Markup(post.content).striptags()[:SEARCH_CONTENT_LENGTH],
+                'url': f"{folder}/{post.url}",
+                'relUrl': post.url,
+            }
+            for post in self.get_all_posts()
+        ]
 
-        with open(self.output_dir / FILE_SEARCH, 'w', encoding='utf-8') as f:
-            f.write(search_json)
+        write_if_changed(self.output_dir / FILE_SEARCH, dump_json(search_index))
 
     def generate_css(self) -> None:
-        """Generate CSS from template with font configurations"""
-        assets_config = self.config.get('assets', {})
-        fonts_config = assets_config.get('fonts', [])
+        """Generate CSS from template with font configurations
 
-        fonts = []
-        for font in fonts_config:
-            font_data = font.copy()
-            weight_str = font.get('weight', 'Regular').lower()
-            font_data['weight_num'] = FONT_WEIGHT_MAP.get(weight_str, '400')
-            fonts.append(font_data)
+        The stylesheet only depends on the config and templates, so with
+        unchanged global dependencies the previous build's file is kept,
+        as long as it is still the one written by that build.
+        """
+        css_file = self.output_dir / DIR_ASSETS / FILE_CODECRAFT_CSS
 
-        template = self.env.get_template(FILE_CSS_TEMPLATE)
-        css_content = template.render(fonts=fonts)
+        if self.previous_css:
+            try:
+                st = os.stat(css_file)
+                if [st.st_size, st.st_mtime_ns] == self.previous_css:
+                    self.css_output = self.previous_css
+                    return
+            except OSError:
+                pass
 
-        assets_dst = self.output_dir / DIR_ASSETS
-        assets_dst.mkdir(parents=True, exist_ok=True)
+        css_file.parent.mkdir(parents=True, exist_ok=True)
+        self._tpl_css.stream(fonts=self.fonts).dump(str(css_file), encoding='utf-8')
 
-        with open(assets_dst / FILE_CODECRAFT_CSS, 'w', encoding='utf-8') as f:
-            f.write(css_content)
+        st = os.stat(css_file)
+        self.css_output = [st.st_size, st.st_mtime_ns]
 
     def clean_output_dir(self) -> None:
         """Remove and recreate the output directory"""
@@ -876,15 +1450,10 @@ class SiteBuilder:
         # Copy theme assets (excluding CSS template)
         assets_src = self.theme_dir / DIR_ASSETS
         if assets_src.exists():
-            assets_dst = self.output_dir / DIR_ASSETS
-            assets_dst.mkdir(parents=True, exist_ok=True)
-
-            for item in assets_src.iterdir():
-                if item.name != FILE_CODECRAFT_CSS:
-                    if item.is_file():
-                        shutil.copy2(item, assets_dst / item.name)
-                    elif item.is_dir():
-                        shutil.copytree(item, assets_dst / item.name, dirs_exist_ok=True)
+            shutil.copytree(assets_src, self.output_dir / DIR_ASSETS, dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns(FILE_CODECRAFT_CSS))
+            # copytree never removes anything, drop assets deleted from the theme
+            prune_tree(assets_src, self.output_dir / DIR_ASSETS, keep=(FILE_CODECRAFT_CSS,))
 
         # Copy examples directory if it exists
         examples_src = self.root_dir / 'examples'
@@ -901,27 +1470,23 @@ class SiteBuilder:
         """Build the entire site"""
         print("Building site...")
 
-        self.clean_output_dir()
-        print("✓ Cleaned output directory")
+        self.build_now = datetime.now()
+        self._prepare_output_dir()
+        print("✓ Prepared output directory")
 
         self.collect_posts()
         self.collect_pages()
+        self._compute_listing_hashes()
         print("✓ Collected posts and pages")
 
         total_posts = sum(len(posts) for posts in self.posts.values())
-        if total_posts > 0:
-            for collection_name, posts in self.posts.items():
-                for post in posts:
-                    output_path = normalize_url_path(post['url'])
-                    self.render_page(post, output_path)
+        self.render_pages([(post, normalize_url_path(post.url))
+                           for posts in self.posts.values() for post in posts])
         print("✓ Rendered posts")
 
-        for page in self.pages:
-            if page['url'] == '/':
-                output_path = ''
-            else:
-                output_path = normalize_url_path(page['url'])
-            self.render_page(page, output_path)
+        # Pages render after posts so listing includes see processed post content
+        self.render_pages([(page, '' if page.url == '/' else normalize_url_path(page.url))
+                           for page in self.pages])
         print("✓ Rendered pages")
 
         self.generate_feed()
@@ -929,12 +1494,61 @@ class SiteBuilder:
         print("✓ Generated feed & search")
 
         self.copy_static_files()
+        self._finish_manifest()
+        self._prune_markdown_cache()
         print("✓ Copied static assets")
 
         print(f"\n✓ Build complete! Output in build/")
         print(f"   Posts: {total_posts}, Pages: {len(self.pages)}")
 
 
+# Per-process builder used by render workers, Jinja environments cannot be pickled
+_RENDER_BUILDER: Optional[SiteBuilder] = None
+
+
+def _init_render_worker(state: Tuple) -> None:
+    """Create the worker's site builder from the parent's collected state
+
+    Args:
+        state: Tuple of (config path, build time, posts, pages, manifest, created directories,
+            listing hash, posts hash)
+    """
+    global _RENDER_BUILDER
+    config_path, build_now, posts, pages, manifest, created_dirs, listing_hash, posts_hash = state
+
+    builder = SiteBuilder(config_path)
+    builder.build_now = build_now
+    builder.posts = posts
+    builder.pages = pages
+    builder.manifest = manifest
+    builder._created_dirs = created_dirs
+    builder._listing_hash = listing_hash
+    builder._posts_hash = posts_hash
+    _RENDER_BUILDER = builder
+
+
+def _render_page_worker(page_data: PostData, output_path: str) -> Tuple[List, str]:
+    """Render one page in a worker process
+
+    Args:
+        page_data: Page data record
+        output_path: Output path relative to build directory
+
+    Returns:
+        Tuple of (manifest entry, content with include directives processed)
+    """
+    _RENDER_BUILDER.render_page(page_data, output_path)
+    return _RENDER_BUILDER.rendered_outputs[output_path], page_data.content
+
+
 if __name__ == '__main__':
-    builder = SiteBuilder()
+    parser = argparse.ArgumentParser(description='Build the CodeCraft site for publishing')
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Rebuild every page from a clean output directory'
+    )
+    args = parser.parse_args()
+
+    builder = SiteBuilder(incremental=not args.force)
     builder.build()
@@ -0,0 +1,63 @@
+"""Incremental builds must re-render pages whose template context changed"""
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# A sidebar that lists posts, so every page depends on them
+SIDEBAR_POSTS = ('{% for collection in posts.values() %}{% for post in collection %}'
+                 '<span class="aside-post">{{ post.title }}</span>{% endfor %}{% endfor %}\n')
+
+EDITED_POST = Path('content') / 'design' / 'star-rating.md'
+OTHER_PAGE = Path('build') / 'code' / 'email-obfuscation' / 'index.html'
+
+
+class IncrementalSidebarTest(unittest.TestCase):
+    """Editing a post re-renders pages that only show it in the sidebar"""
+
+    def setUp(self):
+        self.site = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.site, ignore_errors=True)
+
+        for name in ('codecraft.py', 'publish.py'):
+            shutil.copy2(ROOT / name, self.site / name)
+        for name in ('assets', 'content', 'examples', 'themes'):
+            if (ROOT / name).exists():
+                shutil.copytree(ROOT / name, self.site / name)
+
+        aside = self.site / 'themes' / 'templates' / 'aside.html'
+        aside.write_text(SIDEBAR_POSTS + aside.read_text(encoding='utf-8'), encoding='utf-8')
+
+    def run_build(self, *command):
+        subprocess.run([sys.executable, *command], cwd=self.site, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def edit_post_title(self):
+        post = self.site / EDITED_POST
+        post.write_text(post.read_text(encoding='utf-8').replace(
+            'title: "CSS: Star Rating"', 'title: "CSS: Edited Rating"'), encoding='utf-8')
+
+    def assert_sidebar_updated(self):
+        page = (self.site / OTHER_PAGE).read_text(encoding='utf-8')
+        self.assertIn('CSS: Edited Rating', page)
+        self.assertNotIn('CSS: Star Rating', page)
+
+    def test_codecraft_rerenders_sidebar(self):
+        self.run_build('codecraft.py', 'build')
+        self.edit_post_title()
+        self.run_build('codecraft.py', 'build')
+        self.assert_sidebar_updated()
+
+    def test_publish_rerenders_sidebar(self):
+        self.run_build('publish.py')
+        self.edit_post_title()
+        self.run_build('publish.py')
+        self.assert_sidebar_updated()
+
+
+if __name__ == '__main__':
+    unittest.main()